@@ -1,14 +1,28 @@
 import os
 import base64
+import bisect
+import functools
 import json
+import re
 import sys
+import tempfile
+import time
 import traceback # For detailed error logging in worker
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                              QLineEdit, QPushButton, QListWidget, QListWidgetItem,
                              QTextEdit, QFileDialog, QMessageBox, QGroupBox,
-                             QLabel, QFormLayout, QProgressBar, QStatusBar, QStyle) # Added QProgressBar, QStatusBar, QStyle
-from PySide6.QtCore import (Qt, QObject, Signal, QRunnable, QThreadPool, QSettings, QTimer, Slot) # Added QTimer, Slot
-from PySide6.QtGui import QIcon # Added QIcon
+                             QLabel, QGridLayout, QProgressBar, QStatusBar, QStyle) # Added QProgressBar, QStatusBar, QStyle
+from PySide6.QtCore import (Qt, QObject, Signal, QRunnable, QThreadPool, QSettings, QTimer, Slot,
+                            QSignalBlocker, QThread, QMetaObject, QMetaMethod, QStandardPaths) # Added QTimer, Slot, QSignalBlocker, QThread, QMetaObject, QMetaMethod, QStandardPaths
+from PySide6.QtGui import QIcon, QTextCursor, QAbstractFileIconProvider # Added QIcon, QTextCursor, QAbstractFileIconProvider
+
+try:
+    import orjson # Optional: much faster snapshot (de)serialization
+except ImportError:
+    orjson = None
+
+# Accepted extension format: leading dot, an alphanumeric, then up to 15 filename-safe characters
+EXTENSION_PATTERN = re.compile(r'^\.[A-Za-z0-9][A-Za-z0-9_+\-]{0,15}$')
 
 
 # ------------------------ Model ------------------------#
@@ -37,98 +51,108 @@ class Model:
             'directories': [],
             'files': []
         }
-        # Ensure extensions are lowercase for case-insensitive matching
-        extensions = [ext.lower() for ext in extensions]
+        # Ensure extensions are lowercase for case-insensitive matching (set: O(1) lookups)
+        extensions = {ext.lower() for ext in extensions}
 
         if file_log_callback:
             file_log_callback(f"🔍 Starting scan in: {root_dir}")
 
-        # --- First Pass: Count matching files for progress bar ---
-        total_files_to_process = 0
-        if progress_callback:
+        # --- Single traversal: collect directories and matching files ---
+        # (The match count for the progress bar falls out of this; no separate counting pass.)
+        if progress_callback and file_log_callback:
+            file_log_callback("⏳ Counting files for progress...")
+        try:
+            rel_dirs, matched_files = self._scan_tree(root_dir, extensions)
+        except OSError as e:
             if file_log_callback:
-                file_log_callback("⏳ Counting files for progress...")
-            try:
-                for _, _, filenames in os.walk(root_dir):
-                    for filename in filenames:
-                        _ , ext_part = os.path.splitext(filename)
-                        if ext_part and ext_part.lower() in extensions:
-                            total_files_to_process += 1
-            except OSError as e:
-                 if file_log_callback:
-                    file_log_callback(f"❌ Error during file counting: {e}")
-                 raise # Re-raise the error to be caught by the worker
+                file_log_callback(f"❌ Error during directory walk: {e}")
+            raise # Re-raise the error to be caught by the worker
+        self.database['directories'] = rel_dirs
+        total_files_to_process = len(matched_files)
+        if progress_callback:
             progress_callback(0, total_files_to_process) # Initialize progress
             if file_log_callback:
                 file_log_callback(f"🔢 Found {total_files_to_process} files matching extensions.")
-        # --- End First Pass ---
+        # --- End traversal ---
 
 
-        # --- Second Pass: Collect directories and process files ---
+        # --- Process files ---
         processed_files_count = 0
-        try:
-            # Collect directories first to ensure structure exists if needed later
-            for dirpath, _, _ in os.walk(root_dir):
-                # Calculate relative path from the root directory
-                rel_dir = os.path.relpath(dirpath, root_dir)
-                # Store only non-root relative paths
-                if rel_dir and rel_dir != '.':
-                    # Normalize path separators for consistency
-                    self.database['directories'].append(rel_dir.replace(os.sep, '/'))
-
-            # Collect and encode files
-            for dirpath, _, filenames in os.walk(root_dir):
-                for filename in filenames:
-                    _ , ext_part = os.path.splitext(filename)
-                    # Skip files without extensions
-                    if not ext_part: continue
-                    ext = ext_part.lower()
-
-                    # Process only files with matching extensions
-                    if ext in extensions:
-                        file_path = os.path.join(dirpath, filename)
-                        # Calculate relative path for storage
-                        rel_path = os.path.relpath(file_path, root_dir).replace(os.sep, '/')
-                        try:
-                            # Read file content as binary
-                            with open(file_path, 'rb') as f:
-                                content = f.read()
-                            # Encode content in Base64
-                            content_b64 = base64.b64encode(content).decode('utf-8')
-                            # Store file info in the database
-                            self.database['files'].append({
-                                'path': rel_path,
-                                'content_base64': content_b64
-                            })
-                            processed_files_count += 1
-                            if file_log_callback:
-                                file_log_callback(f"  [Encode] -> {rel_path}")
-                            if progress_callback:
-                                # Update progress after successful processing
-                                progress_callback(processed_files_count, total_files_to_process)
-
-                        except Exception as e:
-                            # Log errors encountered during file reading/encoding
-                            if file_log_callback:
-                                file_log_callback(f"  [Error reading {rel_path}] -> {e}")
-                            # Decide if errors should count towards progress (currently they don't)
+        for file_path, rel_path in matched_files:
+            try:
+                # Read file content as binary
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+                # Encode content in Base64 (output is pure ASCII)
+                content_b64 = base64.b64encode(content).decode('ascii')
+                # Store file info in the database
+                self.database['files'].append({
+                    'path': rel_path,
+                    'content_base64': content_b64
+                })
+                processed_files_count += 1
+                if file_log_callback:
+                    file_log_callback(f"  [Encode] -> {rel_path}")
+                if progress_callback:
+                    # Update progress after successful processing
+                    progress_callback(processed_files_count, total_files_to_process)
 
-        except OSError as e:
-            if file_log_callback:
-                file_log_callback(f"❌ Error during directory walk: {e}")
-            raise # Re-raise the error
+            except Exception as e:
+                # Log errors encountered during file reading/encoding
+                if file_log_callback:
+                    file_log_callback(f"  [Error reading {rel_path}] -> {e}")
+                # Decide if errors should count towards progress (currently they don't)
 
         if file_log_callback:
             file_log_callback(f"📊 Scan complete. Found {len(self.database['directories'])} subdirs and encoded {processed_files_count} files.")
-        # --- End Second Pass ---
+        # --- End Process files ---
+
+    @staticmethod
+    def _scan_tree(root_dir, extensions):
+        """
+        Walks root_dir once with os.scandir (top-down, symlinks not followed, unreadable
+        subdirectories skipped like os.walk does).
+
+        Returns:
+            tuple: (relative subdirectory paths, [(absolute file path, relative file path)])
+                   for files whose lowercase extension is in `extensions`. Relative paths use '/'.
+        """
+        rel_dirs = []
+        matched_files = []
+        pending = [(root_dir, '')] # (directory path, its '/'-separated path relative to root_dir)
+        while pending:
+            dir_path, rel_dir = pending.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue # Same as os.walk's default: silently skip unreadable directories
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, rel_path))
+                        continue
+                except OSError:
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext and ext in extensions:
+                    matched_files.append((entry.path, rel_path))
+            rel_dirs.extend(rel for _, rel in subdirs)
+            pending.extend(reversed(subdirs)) # Visit subdirectories in listing order
+        return rel_dirs, matched_files
 
     def save_database(self, json_path):
         """Saves the current database to a JSON file."""
         try:
             # Ensure the directory for the JSON file exists
             os.makedirs(os.path.dirname(json_path), exist_ok=True)
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(self.database, f, indent=2)
+            if orjson is not None:
+                with open(json_path, 'wb') as f:
+                    f.write(orjson.dumps(self.database, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.database, f, indent=2)
         except OSError as e:
             # Log or raise error if saving fails
             print(f"Error saving database to {json_path}: {e}") # Simple print, consider logging
@@ -137,13 +161,17 @@ class Model:
     def load_database(self, json_path):
         """Loads the database from a JSON file."""
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                self.database = json.load(f)
+            if orjson is not None:
+                with open(json_path, 'rb') as f:
+                    self.database = orjson.loads(f.read())
+            else:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    self.database = json.load(f)
         except FileNotFoundError:
             print(f"Error: Database file not found at {json_path}")
             self.database = {'directories': [], 'files': []} # Reset database
             raise
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e: # Also covers orjson.JSONDecodeError (a subclass)
             print(f"Error decoding JSON from {json_path}: {e}")
             self.database = {'directories': [], 'files': []} # Reset database
             raise
@@ -177,9 +205,11 @@ class Model:
 
         # --- Create directories ---
         dir_count = 0
+        created_dirs = set() # Directories known to exist; file writes skip makedirs for these
         try:
             # Ensure the main output directory exists
             os.makedirs(output_dir, exist_ok=True)
+            created_dirs.add(os.path.normpath(output_dir))
             # Create all subdirectories listed in the database
             for rel_dir in self.database.get('directories', []):
                 # Skip empty or '.' relative paths
@@ -188,6 +218,7 @@ class Model:
                         # Construct full path and create directory
                         dir_path = os.path.join(output_dir, rel_dir.replace('/', os.sep)) # Use OS-specific separator
                         os.makedirs(dir_path, exist_ok=True)
+                        created_dirs.add(os.path.normpath(dir_path))
                         dir_count += 1
                     except Exception as e:
                         # Log errors during directory creation
@@ -216,10 +247,11 @@ class Model:
             file_path = os.path.join(output_dir, rel_path.replace('/', os.sep)) # Use OS-specific separator
             file_dir = os.path.dirname(file_path)
 
-            # Ensure the file's directory exists
-            if file_dir:
+            # Ensure the file's directory exists (once per directory, not once per file)
+            if file_dir and os.path.normpath(file_dir) not in created_dirs:
                 try:
                     os.makedirs(file_dir, exist_ok=True)
+                    created_dirs.add(os.path.normpath(file_dir))
                 except Exception as e:
                     if file_log_callback:
                         file_log_callback(f"  [Error creating dir for file {rel_path}] -> {e}")
@@ -254,8 +286,34 @@ class WorkerSignals(QObject):
     error = Signal(str)         # Emitted when an error occurs in the task
     finished = Signal()         # Emitted when the task is finished (success or error)
     log_message = Signal(str)   # Emitted for logging messages during the task
-    progress_update = Signal(int) # Emitted with the current progress percentage (0-100)
-    progress_max = Signal(int)    # Emitted with the maximum value for progress (usually total files)
+    log_batch = Signal(list)    # Emitted with several buffered log messages at once
+    log_file = Signal(str)      # Emitted once per task with the path of the full on-disk log
+    progress = Signal(int, int) # Emitted with (current, total) progress (total is usually the file count)
+
+
+# ------------------------ Settings Writer ------------------------#
+class SettingsWriter(QObject):
+    """Owns a QSettings instance on a background thread and performs all writes there."""
+    def __init__(self, organization, application):
+        """Initializes the writer; move it to its thread before use."""
+        super().__init__()
+        # Parented to the writer so moveToThread() takes it along
+        self.settings = QSettings(organization, application, self)
+
+    @Slot(str, object)
+    def set_value(self, key, value):
+        """Stores a single settings value."""
+        self.settings.setValue(key, value)
+
+    @Slot()
+    def sync(self):
+        """
+        Flushes written values to permanent storage.
+
+        Only called once, at shutdown: while the thread runs, Qt syncs on its own
+        from the event loop, but that can no longer happen after the thread stops.
+        """
+        self.settings.sync()
 
 
 # ------------------------ ViewModel ------------------------#
@@ -268,6 +326,8 @@ class ViewModel(QObject):
     progress_changed = Signal(int)      # Signal to update the progress bar's value
     progress_max_changed = Signal(int)  # Signal to update the progress bar's maximum
     operation_active = Signal(bool)     # Signal to show/hide the progress bar and disable buttons
+    confirm_create_dir_requested = Signal(str) # Asks the View whether to create a missing output directory
+    _settings_write = Signal(str, object) # Internal: hands a settings write to the SettingsWriter thread
 
     # --- Settings Keys ---
     SETTINGS_EXTENSIONS = "extensions"
@@ -275,31 +335,117 @@ class ViewModel(QObject):
     SETTINGS_COPY_JSON_PATH = "paths/copyJsonPath"
     SETTINGS_PASTE_JSON_PATH = "paths/pasteJsonPath"
     SETTINGS_PASTE_OUTPUT_DIR = "paths/pasteOutputDir"
+    # Settings changes are coalesced and persisted after this quiet period
+    SETTINGS_SAVE_DELAY_MS = 500
+    # How long a cached "is this a directory?" answer stays valid (seconds)
+    STAT_CACHE_TTL_S = 1.0
 
     def __init__(self, model):
         """Initializes the ViewModel."""
         super().__init__()
         self.model = model
-        self.threadpool = QThreadPool()
-        # Use a unique name for settings to avoid conflicts
-        self.settings = QSettings("HoangAnhTran", "DirSnapshotApp_v3_Fixed")
+        # Dedicated single-thread pool: copy/paste are disk-bound and run one at a time
+        # (see operation_active), so extra threads would only compete for the same disk
+        self.threadpool = QThreadPool(self)
+        self.threadpool.setMaxThreadCount(1)
+        self.threadpool.setExpiryTimeout(30_000) # Keep the thread warm between operations
+        # One long-lived signals object shared by every Worker (operations run one at a time).
+        # Workers emit from a pool thread, so deliveries are explicitly queued onto the GUI thread.
+        self.worker_signals = WorkerSignals()
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker_signals.error.connect(self._handle_task_error, queued)
+        self.worker_signals.finished.connect(self._handle_task_finished, queued)
+        self.worker_signals.log_message.connect(self._handle_log_message, queued)
+        self.worker_signals.log_batch.connect(self._handle_log_batch, queued)
+        self.worker_signals.log_file.connect(self._handle_log_file, queued)
+        self.worker_signals.progress.connect(self._handle_progress, queued)
+        # Use a unique name for settings to avoid conflicts.
+        # The writer's QSettings is the only settings handle in the app: it is read here once,
+        # before it moves to its thread, and afterwards only written to from that thread.
+        self._settings_writer = SettingsWriter("HoangAnhTran", "DirSnapshotApp_v3_Fixed")
+        settings = self._settings_writer.settings
 
         # --- Load persistent settings ---
         default_extensions = ['.txt', '.py', '.md', '.cpp', '.h'] # Added C++ extensions
         # Use .value() with defaultValue for robustness
-        self._extensions = self.settings.value(self.SETTINGS_EXTENSIONS, defaultValue=default_extensions, type=list)
-        self._copy_source_dir = self.settings.value(self.SETTINGS_COPY_SOURCE_DIR, defaultValue='', type=str)
-        self._copy_json_path = self.settings.value(self.SETTINGS_COPY_JSON_PATH, defaultValue='', type=str)
-        self._paste_json_path = self.settings.value(self.SETTINGS_PASTE_JSON_PATH, defaultValue='', type=str)
-        self._paste_output_dir = self.settings.value(self.SETTINGS_PASTE_OUTPUT_DIR, defaultValue='', type=str)
+        # Normalised and de-duplicated, so lists saved with mixed-case duplicates load cleanly
+        self._extensions = sorted({ext.strip().lower() for ext in
+                                   settings.value(self.SETTINGS_EXTENSIONS, defaultValue=default_extensions, type=list)})
+        self._extensions_set = set(self._extensions) # O(1) membership checks; mirrors _extensions
+        self._copy_source_dir = settings.value(self.SETTINGS_COPY_SOURCE_DIR, defaultValue='', type=str)
+        self._copy_json_path = settings.value(self.SETTINGS_COPY_JSON_PATH, defaultValue='', type=str)
+        self._paste_json_path = settings.value(self.SETTINGS_PASTE_JSON_PATH, defaultValue='', type=str)
+        self._paste_output_dir = settings.value(self.SETTINGS_PASTE_OUTPUT_DIR, defaultValue='', type=str)
+
+        self._settings_thread = QThread(self)
+        self._settings_writer.moveToThread(self._settings_thread)
+        self._settings_write.connect(self._settings_writer.set_value, Qt.ConnectionType.QueuedConnection)
+        self._settings_thread.start()
+        # Last persisted value per key; QSettings is never re-read and unchanged values aren't re-written
+        self._settings_cache = {
+            self.SETTINGS_EXTENSIONS: list(self._extensions),
+            self.SETTINGS_COPY_SOURCE_DIR: self._copy_source_dir,
+            self.SETTINGS_COPY_JSON_PATH: self._copy_json_path,
+            self.SETTINGS_PASTE_JSON_PATH: self._paste_json_path,
+            self.SETTINGS_PASTE_OUTPUT_DIR: self._paste_output_dir,
+        }
+
+        # --- Debounced settings persistence ---
+        self._pending_settings = {} # key -> latest value not yet written
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_settings)
+
+        self._stat_cache = {} # path -> (monotonic timestamp, is_dir); see _is_dir_cached
+
+        # Resets the progress bar shortly after a task ends (reused for every task)
+        self._reset_progress_timer = QTimer(self)
+        self._reset_progress_timer.setSingleShot(True)
+        self._reset_progress_timer.setInterval(150)
+        self._reset_progress_timer.timeout.connect(self._do_reset_progress)
 
         # Emit initial status message
         self.status_update.emit("Application loaded settings.", 3000)
 
 
+    # --- Settings persistence ---
+    def _set(self, key, value):
+        """Persists a settings value if it differs from the cached one."""
+        if self._settings_cache.get(key) == value:
+            return # No-op write
+        self._settings_cache[key] = value
+        self._queue_setting(key, value)
+
+    def _queue_setting(self, key, value):
+        """Records a settings change; it is written once edits pause (see flush_settings)."""
+        self._pending_settings[key] = value
+        self._save_timer.start() # (Re)start the quiet-period countdown
+
+    @Slot()
+    def flush_settings(self):
+        """Hands all pending settings changes to the SettingsWriter thread (non-blocking)."""
+        self._save_timer.stop()
+        for key, value in self._pending_settings.items():
+            self._settings_write.emit(key, value)
+        self._pending_settings.clear()
+
+    @Slot()
+    def shutdown(self):
+        """Flushes pending settings, waits for them to reach disk and stops the writer thread."""
+        if not self._settings_thread.isRunning():
+            return
+        self.flush_settings()
+        # Blocks until the writer has processed every queued write (queued calls run in order)
+        QMetaObject.invokeMethod(self._settings_writer, "sync", Qt.ConnectionType.BlockingQueuedConnection)
+        self._settings_thread.quit()
+        self._settings_thread.wait()
+    # --- End Settings persistence ---
+
+
     # --- Properties with Persistence ---
     # Properties provide controlled access to the ViewModel's state
-    # and automatically save changes to QSettings.
+    # and automatically save changes to QSettings (debounced).
 
     @property
     def copy_source_dir(self):
@@ -312,7 +458,7 @@ class ViewModel(QObject):
         """Sets the source directory path and saves it to settings."""
         if self._copy_source_dir != value: # Only update if value changed
             self._copy_source_dir = value
-            self.settings.setValue(self.SETTINGS_COPY_SOURCE_DIR, value)
+            self._set(self.SETTINGS_COPY_SOURCE_DIR, value)
             self.status_update.emit("Copy source path updated.", 1500) # Provide feedback
 
     @property
@@ -326,7 +472,7 @@ class ViewModel(QObject):
         """Sets the output JSON file path and saves it to settings."""
         if self._copy_json_path != value:
             self._copy_json_path = value
-            self.settings.setValue(self.SETTINGS_COPY_JSON_PATH, value)
+            self._set(self.SETTINGS_COPY_JSON_PATH, value)
             self.status_update.emit("Copy JSON path updated.", 1500)
 
     @property
@@ -340,7 +486,7 @@ class ViewModel(QObject):
         """Sets the input JSON file path and saves it to settings."""
         if self._paste_json_path != value:
             self._paste_json_path = value
-            self.settings.setValue(self.SETTINGS_PASTE_JSON_PATH, value)
+            self._set(self.SETTINGS_PASTE_JSON_PATH, value)
             self.status_update.emit("Paste JSON path updated.", 1500)
 
     @property
@@ -354,37 +500,11 @@ class ViewModel(QObject):
         """Sets the output directory path and saves it to settings."""
         if self._paste_output_dir != value:
             self._paste_output_dir = value
-            self.settings.setValue(self.SETTINGS_PASTE_OUTPUT_DIR, value)
+            self._set(self.SETTINGS_PASTE_OUTPUT_DIR, value)
             self.status_update.emit("Paste output path updated.", 1500)
     # --- End Properties ---
 
 
-    # --- Explicit Slots for Text Input Changes (NEW) ---
-    # These slots are connected to the textChanged signals of QLineEdits
-    # to ensure ViewModel properties are updated correctly.
-
-    @Slot(str)
-    def set_copy_source_dir(self, value):
-        """Slot to update the copy source directory from the View."""
-        self.copy_source_dir = value # Uses the property setter
-
-    @Slot(str)
-    def set_copy_json_path(self, value):
-        """Slot to update the copy JSON path from the View."""
-        self.copy_json_path = value # Uses the property setter
-
-    @Slot(str)
-    def set_paste_json_path(self, value):
-        """Slot to update the paste JSON path from the View."""
-        self.paste_json_path = value # Uses the property setter
-
-    @Slot(str)
-    def set_paste_output_dir(self, value):
-        """Slot to update the paste output directory from the View."""
-        self.paste_output_dir = value # Uses the property setter
-    # --- End Explicit Slots ---
-
-
     # --- Extensions management ---
     @property
     def extensions(self):
@@ -394,14 +514,15 @@ class ViewModel(QObject):
 
     def add_extension(self, ext):
         """Adds a new extension to the list if valid and not present."""
+        ext = (ext or '').strip().lower() # Normalise first: membership is checked on the stored (lowercase) form
         # Basic validation for the extension format
-        if ext and ext.startswith('.') and ext not in self._extensions:
-            self._extensions.append(ext.lower()) # Store lowercase
-            self._extensions.sort() # Keep the list sorted
-            self.settings.setValue(self.SETTINGS_EXTENSIONS, self._extensions) # Save changes
+        if ext and ext.startswith('.') and ext not in self._extensions_set:
+            bisect.insort(self._extensions, ext) # Keep the list sorted
+            self._extensions_set.add(ext)
+            self._set(self.SETTINGS_EXTENSIONS, list(self._extensions)) # Save changes (copy: the list is mutated in place)
             self.extensions_changed.emit(self.extensions) # Notify View
             self.status_update.emit(f"Extension '{ext}' added.", 2000)
-        elif ext in self._extensions:
+        elif ext in self._extensions_set:
              self.status_update.emit(f"Extension '{ext}' already exists.", 2000)
         else:
              self.status_update.emit(f"Invalid extension format: '{ext}'. Must start with '.'", 3000)
@@ -409,12 +530,25 @@ class ViewModel(QObject):
 
     def remove_extension(self, ext):
         """Removes an extension from the list."""
-        if ext in self._extensions:
+        ext = ext.strip().lower() # Same normalisation as add_extension
+        if ext in self._extensions_set:
             self._extensions.remove(ext)
+            self._extensions_set.discard(ext)
             # No need to sort again after removal
-            self.settings.setValue(self.SETTINGS_EXTENSIONS, self._extensions) # Save changes
+            self._set(self.SETTINGS_EXTENSIONS, list(self._extensions)) # Save changes
             self.extensions_changed.emit(self.extensions) # Notify View
             self.status_update.emit(f"Extension '{ext}' removed.", 2000)
+
+    def remove_extensions(self, exts):
+        """Removes several extensions at once, saving and notifying the View a single time."""
+        to_remove = self._extensions_set.intersection(ext.strip().lower() for ext in exts)
+        if not to_remove:
+            return
+        self._extensions = [ext for ext in self._extensions if ext not in to_remove] # Order is preserved
+        self._extensions_set -= to_remove
+        self._set(self.SETTINGS_EXTENSIONS, list(self._extensions)) # Save changes
+        self.extensions_changed.emit(self.extensions) # Notify View
+        self.status_update.emit(f"Removed {len(to_remove)} extension(s).", 2000)
     # --- End Extensions management ---
 
 
@@ -422,6 +556,16 @@ class ViewModel(QObject):
     # These methods trigger the core operations (copy/paste)
     # They perform validation and run the tasks in separate threads.
 
+    def _is_dir_cached(self, path, ttl=STAT_CACHE_TTL_S):
+        """os.path.isdir with a short-lived cache, so repeated validations don't re-stat."""
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        is_dir = os.path.isdir(path)
+        self._stat_cache[path] = (now, is_dir)
+        return is_dir
+
     @Slot() # Define as a slot for potential connection from View if needed
     def perform_copy(self):
         """Validates inputs and starts the copy (scan and save) operation."""
@@ -430,7 +574,7 @@ class ViewModel(QObject):
             self.message_logged.emit("⚠️ Please select a source directory.")
             self.status_update.emit("Copy failed: No source directory selected.", 3000)
             return
-        if not os.path.isdir(self.copy_source_dir):
+        if not self._is_dir_cached(self.copy_source_dir):
              self.message_logged.emit(f"⚠️ Source directory not found or is not a directory: {self.copy_source_dir}")
              self.status_update.emit("Copy failed: Invalid source directory.", 3000)
              return
@@ -442,24 +586,32 @@ class ViewModel(QObject):
             return
         # Check if the directory for the JSON file exists (optional, save_database handles it)
         json_dir = os.path.dirname(self.copy_json_path)
-        if json_dir and not os.path.isdir(json_dir):
+        if json_dir and not self._is_dir_cached(json_dir):
              try:
                  os.makedirs(json_dir, exist_ok=True)
+                 self._stat_cache.pop(json_dir, None) # Cached "missing" answer is now stale
                  self.message_logged.emit(f"📁 Created directory for JSON file: {json_dir}")
              except OSError as e:
                  self.message_logged.emit(f"❌ Could not create directory for JSON file: {json_dir} - Error: {e}")
                  self.status_update.emit("Copy failed: Cannot create JSON directory.", 4000)
                  return
 
+        # Snapshot the inputs as locals: the task sees the values from when it was started
+        # and doesn't go through the properties (or copy the extensions list) from the worker thread
+        model = self.model
+        source_dir = self.copy_source_dir
+        extensions = self._extensions[:]
+        json_path = self.copy_json_path
+
         # Define the task function to be run in the worker thread
         def copy_task(progress_callback, file_log_callback):
             """The actual work of scanning and saving."""
             try:
                 # Pass callbacks to the model methods
-                self.model.scan_directory(self.copy_source_dir, self.extensions, progress_callback, file_log_callback)
-                self.model.save_database(self.copy_json_path)
+                model.scan_directory(source_dir, extensions, progress_callback, file_log_callback)
+                model.save_database(json_path)
                 # Log success via the worker's log signal
-                file_log_callback(f"💾 Snapshot database saved successfully to: {self.copy_json_path}")
+                file_log_callback(f"💾 Snapshot database saved successfully to: {json_path}")
             except Exception as e:
                 # Log error via the worker's log signal and re-raise to trigger worker's error signal
                 detailed_error = f"{type(e).__name__}: {e}"
@@ -492,34 +644,45 @@ class ViewModel(QObject):
             self.message_logged.emit("⚠️ Please select a valid output directory.")
             self.status_update.emit("Paste failed: No output directory selected.", 3000)
             return
-        if not os.path.isdir(self.paste_output_dir):
-            # Ask user if they want to create the output directory
-            reply = QMessageBox.question(None, "Create Directory?", # Parent can be None here
-                                         f"The output directory does not exist:\n{self.paste_output_dir}\n\nDo you want to create it?",
-                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                         QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                try:
-                    os.makedirs(self.paste_output_dir, exist_ok=True)
-                    self.message_logged.emit(f"📁 Created output directory: {self.paste_output_dir}")
-                except OSError as e:
-                    self.message_logged.emit(f"❌ Failed to create output directory: {e}")
-                    self.status_update.emit("Paste failed: Could not create output directory.", 4000)
-                    return
-            else:
-                self.message_logged.emit("ℹ️ Paste operation cancelled by user (output directory not created).")
-                self.status_update.emit("Paste cancelled.", 3000)
-                return
+        if not self._is_dir_cached(self.paste_output_dir):
+            # Ask the user (via the View) whether to create it; continues in on_create_dir_answered
+            self.confirm_create_dir_requested.emit(self.paste_output_dir)
+            return
 
+        self._start_paste()
+
+    @Slot(bool)
+    def on_create_dir_answered(self, create):
+        """Continues perform_paste once the View has answered confirm_create_dir_requested."""
+        if not create:
+            self.message_logged.emit("ℹ️ Paste operation cancelled by user (output directory not created).")
+            self.status_update.emit("Paste cancelled.", 3000)
+            return
+        try:
+            os.makedirs(self.paste_output_dir, exist_ok=True)
+            self._stat_cache.pop(self.paste_output_dir, None) # Cached "missing" answer is now stale
+            self.message_logged.emit(f"📁 Created output directory: {self.paste_output_dir}")
+        except OSError as e:
+            self.message_logged.emit(f"❌ Failed to create output directory: {e}")
+            self.status_update.emit("Paste failed: Could not create output directory.", 4000)
+            return
+        self._start_paste()
+
+    def _start_paste(self):
+        """Starts the paste (load and recreate) task once its inputs are validated."""
+        # Snapshot the inputs as locals (see perform_copy)
+        model = self.model
+        json_in = self.paste_json_path
+        out_dir = self.paste_output_dir
 
         # Define the task function for the worker thread
         def paste_task(progress_callback, file_log_callback):
             """The actual work of loading and recreating."""
             try:
                 # Pass callbacks to the model methods
-                self.model.load_database(self.paste_json_path)
-                file_log_callback(f"📚 Snapshot database loaded from: {self.paste_json_path}")
-                self.model.recreate_from_database(self.paste_output_dir, progress_callback, file_log_callback)
+                model.load_database(json_in)
+                file_log_callback(f"📚 Snapshot database loaded from: {json_in}")
+                model.recreate_from_database(out_dir, progress_callback, file_log_callback)
             except Exception as e:
                  # Log error via the worker's log signal and re-raise
                 detailed_error = f"{type(e).__name__}: {e}"
@@ -534,13 +697,10 @@ class ViewModel(QObject):
 
     def _run_task(self, task_func):
         """Creates a Worker and runs the given task function in the thread pool."""
-        worker = Worker(task_func)
-        # Connect worker signals to ViewModel handlers (slots)
-        worker.signals.error.connect(self._handle_task_error)
-        worker.signals.finished.connect(self._handle_task_finished)
-        worker.signals.log_message.connect(self._handle_log_message)
-        worker.signals.progress_update.connect(self._handle_progress_update)
-        worker.signals.progress_max.connect(self._handle_progress_max)
+        # Signals are shared and already connected (see __init__); the Worker itself is a plain QRunnable
+        worker = Worker(task_func, self.worker_signals)
+        # Log batches end up in message_logged; only produce them if something (the View) listens there
+        worker.set_log_enabled(self.isSignalConnected(QMetaMethod.fromSignal(self.message_logged)))
         # Execute the worker task in the thread pool
         self.threadpool.start(worker)
     # --- End Actions ---
@@ -554,16 +714,23 @@ class ViewModel(QObject):
         """Receives log messages from the worker and forwards them to the View."""
         self.message_logged.emit(message)
 
-    @Slot(int)
-    def _handle_progress_update(self, value):
-        """Receives progress updates (percentage) and forwards them to the View."""
-        self.progress_changed.emit(value)
+    @Slot(list)
+    def _handle_log_batch(self, messages):
+        """Receives a batch of log messages from the worker and forwards them to the View at once."""
+        self.message_logged.emit("\n".join(messages))
 
-    @Slot(int)
-    def _handle_progress_max(self, max_value):
-        """Receives the maximum progress value and forwards it to the View."""
-        # Ensure max value is at least 1 to avoid division by zero issues in progress bar
-        self.progress_max_changed.emit(max_value if max_value > 0 else 1)
+    @Slot(str)
+    def _handle_log_file(self, path):
+        """Tells the user where the complete (per-file) log of the last task was written."""
+        self.message_logged.emit(f"📄 Full log written to: {path}")
+
+    @Slot(int, int)
+    def _handle_progress(self, current, total):
+        """Receives (current, total) progress and forwards the maximum and percentage to the View."""
+        # Ensure total is at least 1 to avoid division by zero issues in progress bar
+        safe_total = max(1, total)
+        self.progress_max_changed.emit(safe_total)
+        self.progress_changed.emit(int(current / safe_total * 100))
 
 
     @Slot(str)
@@ -575,8 +742,8 @@ class ViewModel(QObject):
         self.status_update.emit(f"Operation failed. See log for details.", 5000)
         # Re-enable UI elements and hide progress bar
         self.operation_active.emit(False)
-        # Optionally reset progress bar visually after a short delay
-        QTimer.singleShot(100, lambda: self.progress_changed.emit(0))
+        # Reset progress bar visually after a short delay
+        self._reset_progress_timer.start()
 
 
     @Slot()
@@ -590,8 +757,13 @@ class ViewModel(QObject):
         # self.status_update.emit("Operation finished.", 3000) # Example if needed
         self.operation_active.emit(False) # Hide progress bar, re-enable buttons
         # Reset progress bar visually after a short delay
-        QTimer.singleShot(150, lambda: self.progress_changed.emit(0))
-        QTimer.singleShot(150, lambda: self.progress_max_changed.emit(100)) # Reset max visually
+        self._reset_progress_timer.start()
+
+    @Slot()
+    def _do_reset_progress(self):
+        """Resets the progress bar value and maximum after a task has ended."""
+        self.progress_changed.emit(0)
+        self.progress_max_changed.emit(100) # Reset max visually
     # --- End Signal Handlers ---
 
 
@@ -601,7 +773,20 @@ class Worker(QRunnable):
     Runnable worker task for executing long operations (like scanning/recreating)
     in a separate thread to avoid blocking the main GUI thread.
     """
-    def __init__(self, task_func):
+    # Minimum time between progress emissions (~30 per second is plenty for a progress bar)
+    PROGRESS_EMIT_INTERVAL_NS = 33_000_000
+    # Buffered file-log messages are sent once this many accumulate or this much time passes
+    LOG_BATCH_SIZE = 64
+    LOG_BATCH_INTERVAL_NS = 100_000_000
+    # Per-file detail lines from the Model start with this; they go to the log file only
+    # (error lines are still shown in the UI)
+    DETAIL_LOG_PREFIX = "  ["
+    DETAIL_ERROR_PREFIX = "  [Error"
+    # Per-task log files kept in the log directory; older ones are deleted
+    MAX_KEPT_LOGS = 10
+    LOG_FILE_PREFIX = "sagittarius_"
+
+    def __init__(self, task_func, signals):
         """
         Initializes the Worker.
 
@@ -610,32 +795,105 @@ class Worker(QRunnable):
                                   This function MUST accept two arguments:
                                   progress_callback(current, total) and
                                   file_log_callback(message).
+            signals (WorkerSignals): Long-lived signals object (owned by the ViewModel)
+                                     used to communicate with the main thread.
         """
         super().__init__()
         self.task_func = task_func
-        self.signals = WorkerSignals() # Holds signals to communicate with the main thread
+        self.signals = signals
+        # Progress throttling state: latest (current, total), last pair sent and when it was sent
+        self._pending_progress = None
+        self._sent_progress = None
+        self._last_emit_ns = 0
+        # Log batching state
+        self._has_log_listener = True # Assume someone listens until told otherwise (set_log_enabled)
+        self._log_buffer = []
+        self._last_log_flush_ns = 0
+
+    def set_log_enabled(self, enabled):
+        """Enables/disables file-log delivery; when disabled, file-log messages are dropped at the source."""
+        self._has_log_listener = enabled
+
+    @staticmethod
+    def _log_dir():
+        """Returns (and creates) the directory for per-task logs: app data, or the temp dir as fallback."""
+        base = (QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppLocalDataLocation)
+                or tempfile.gettempdir())
+        log_dir = os.path.join(base, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        return log_dir
+
+    @classmethod
+    def _open_log_file(cls):
+        """Opens a new task log and deletes all but the newest MAX_KEPT_LOGS logs."""
+        log_dir = cls._log_dir()
+        # Timestamped names sort chronologically; the random suffix keeps same-second tasks apart
+        log_file = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=log_dir,
+                                               prefix=f"{cls.LOG_FILE_PREFIX}{time.strftime('%Y%m%d-%H%M%S')}_",
+                                               suffix=".log", delete=False, buffering=1 << 16)
+        with os.scandir(log_dir) as it:
+            logs = sorted(entry.path for entry in it
+                          if entry.name.startswith(cls.LOG_FILE_PREFIX) and entry.name.endswith(".log"))
+        for old_log in logs[:-cls.MAX_KEPT_LOGS]:
+            try:
+                os.remove(old_log)
+            except OSError:
+                pass # Still open elsewhere or already gone; retried on the next task
+        return log_file
+
+    def _flush_log_buffer(self):
+        """Emits all buffered log messages as one batch."""
+        if self._log_buffer:
+            self.signals.log_batch.emit(self._log_buffer)
+            self._log_buffer = [] # New list; the emitted one now belongs to the receiver
+        self._last_log_flush_ns = time.monotonic_ns()
+
+    def _emit_pending_progress(self):
+        """Emits the buffered progress if it differs from what was last sent."""
+        if self._pending_progress is not None and self._pending_progress != self._sent_progress:
+            self.signals.progress.emit(*self._pending_progress)
+            self._sent_progress = self._pending_progress
 
     @Slot() # Make run method a slot
     def run(self):
         """Executes the task function and handles signals."""
+        # Every log line is written to a buffered file on this thread; only summary and
+        # error lines travel through signals to the UI log. The file log is best-effort:
+        # if it can't be opened (read-only or full disk), the task still runs without it.
+        try:
+            log_file = self._open_log_file()
+        except OSError as e:
+            log_file = None
+            self.signals.log_message.emit(f"⚠️ Could not create the log file, per-file details won't be kept: {e}")
         try:
             # --- Define internal callback functions ---
             # These functions will emit signals back to the main thread (ViewModel)
 
-            # Callback for progress updates from the model
+            # Callback for progress updates from the model.
+            # Values are buffered and emitted at most every PROGRESS_EMIT_INTERVAL_NS;
+            # unchanged values are never re-emitted.
             def progress_update_callback(current, total):
-                # Set max value first (important for percentage calculation)
-                # Ensure total is at least 1 to avoid division by zero
-                safe_total = total if total > 0 else 1
-                self.signals.progress_max.emit(safe_total)
-                # Calculate percentage
-                percentage = int((current / safe_total) * 100)
-                self.signals.progress_update.emit(percentage)
+                self._pending_progress = (current, total)
+                now = time.monotonic_ns()
+                if now - self._last_emit_ns > self.PROGRESS_EMIT_INTERVAL_NS:
+                    self._last_emit_ns = now
+                    self._emit_pending_progress()
 
 
-            # Callback for log messages from the model
+            # Callback for log messages from the model (UI lines batched, see LOG_BATCH_SIZE)
+            self._last_log_flush_ns = time.monotonic_ns()
             def log_message_callback(message):
-                self.signals.log_message.emit(message)
+                if log_file is not None:
+                    log_file.write(message + "\n")
+                if (message.startswith(self.DETAIL_LOG_PREFIX)
+                        and not message.startswith(self.DETAIL_ERROR_PREFIX)):
+                    return # Per-file detail: log file only
+                if not self._has_log_listener:
+                    return # Nobody is listening; skip buffering and emission entirely
+                self._log_buffer.append(message)
+                if (len(self._log_buffer) >= self.LOG_BATCH_SIZE
+                        or time.monotonic_ns() - self._last_log_flush_ns > self.LOG_BATCH_INTERVAL_NS):
+                    self._flush_log_buffer()
 
             # --- Execute the provided task function ---
             # Pass the internal callbacks to the task function
@@ -647,7 +905,10 @@ class Worker(QRunnable):
             # --- Error Handling ---
             # Capture any exception during task execution
             error_info = f"{type(e).__name__}: {str(e)}"
-            # Emit the error message via the log signal for the main log area
+            self._flush_log_buffer() # Keep buffered messages ahead of the error in the log
+            # Emit the error message via the log signal for the main log area (and keep it in the log file)
+            if log_file is not None:
+                log_file.write(f"❌ Worker Error: {error_info}\n")
             self.signals.log_message.emit(f"❌ Worker Error: {error_info}")
             # Emit the specific error signal for status bar/dialogs
             self.signals.error.emit(error_info)
@@ -655,18 +916,67 @@ class Worker(QRunnable):
             traceback.print_exc()
         finally:
             # --- Cleanup ---
+            # Send the last buffered log messages and progress so nothing is lost
+            self._flush_log_buffer()
+            self._emit_pending_progress()
+            if log_file is not None:
+                log_file.close()
+                self.signals.log_file.emit(log_file.name)
             # Always emit the finished signal, regardless of success or error
             self.signals.finished.emit()
 
 
 # ------------------------ View ------------------------#
+class FixedIconProvider(QAbstractFileIconProvider):
+    """File icon provider that returns one precomputed icon instead of querying the shell."""
+    def __init__(self, icon):
+        super().__init__()
+        self._icon = icon
+
+    def icon(self, _type_or_info):
+        """Returns the fixed icon for any entry."""
+        return self._icon
+
+
 class View(QWidget):
     """The main application window (GUI)."""
+    # Delay before typed path text is pushed to the ViewModel (collapses keystroke bursts)
+    TEXT_COMMIT_DELAY_MS = 200
+    # Queued log lines are written to the log widget at most this often
+    LOG_FLUSH_INTERVAL_MS = 50
+    # Oldest log lines are dropped beyond this many (bounds memory on long runs)
+    LOG_MAX_BLOCKS = 5000
+    # Progress bar repaint interval while an operation runs (~30 Hz)
+    PROGRESS_REFRESH_INTERVAL_MS = 33
+    # Standard style icons used by init_ui, resolved once per process (see _icons)
+    _ICON_PIXMAPS = (
+        QStyle.StandardPixmap.SP_DirOpenIcon,
+        QStyle.StandardPixmap.SP_DialogSaveButton,
+        QStyle.StandardPixmap.SP_DialogOpenButton,
+        QStyle.StandardPixmap.SP_FileDialogNewFolder,
+        QStyle.StandardPixmap.SP_TrashIcon,
+        QStyle.StandardPixmap.SP_CommandLink,
+        QStyle.StandardPixmap.SP_ArrowRight,
+    )
+    _ICON_CACHE = {}
+
     def __init__(self, viewmodel):
         """Initializes the View."""
         super().__init__()
         self.viewmodel = viewmodel
+        self._edit_commits = [] # (debounce timer, commit function) per bound line edit
+        self._ext_set = set()  # Extensions currently shown in ext_list
+        self._confirm_box = None # Created on the first bulk removal (see _confirm_remove_box)
         self.init_ui()       # Create UI elements
+        self._log_cursor = self.log.textCursor() # Dedicated cursor so user selection isn't disturbed
+        self._log_queue = [] # Messages waiting for the next flush
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._pending_progress = 0 # Latest progress value, applied on the next refresh tick
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_REFRESH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._refresh_progress)
         self.apply_styles()  # Apply CSS-like styling
         self.connect_signals() # Connect UI elements to ViewModel and vice-versa
         self.load_initial_data() # Populate UI with initial values from ViewModel
@@ -679,35 +989,42 @@ class View(QWidget):
         main_layout.setSpacing(15) # Add spacing between main sections
 
         # --- Icons (using standard Qt icons) ---
-        self.icon_folder_open = self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
-        self.icon_save = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton)
-        self.icon_open = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton)
-        self.icon_add = self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogNewFolder) # Using 'New Folder' icon for Add
-        self.icon_remove = self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon)
-        self.icon_copy = self.style().standardIcon(QStyle.StandardPixmap.SP_CommandLink) # Using CommandLink for Copy action
-        self.icon_paste = self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight) # Using ArrowRight for Paste action
+        icons = self._icons(self.style())
+        self.icon_folder_open = icons[QStyle.StandardPixmap.SP_DirOpenIcon]
+        self.icon_save = icons[QStyle.StandardPixmap.SP_DialogSaveButton]
+        self.icon_open = icons[QStyle.StandardPixmap.SP_DialogOpenButton]
+        self.icon_add = icons[QStyle.StandardPixmap.SP_FileDialogNewFolder] # Using 'New Folder' icon for Add
+        self.icon_remove = icons[QStyle.StandardPixmap.SP_TrashIcon]
+        self.icon_copy = icons[QStyle.StandardPixmap.SP_CommandLink] # Using CommandLink for Copy action
+        self.icon_paste = icons[QStyle.StandardPixmap.SP_ArrowRight] # Using ArrowRight for Paste action
+        self._dir_icon_provider = FixedIconProvider(self.icon_folder_open) # For the directory pickers
 
 
         # --- Copy Section ---
         copy_group = QGroupBox("1. Snapshot Source Directory (Copy)")
-        copy_layout = QFormLayout()
-        copy_layout.setSpacing(10) # Spacing within the form
+        copy_layout = QGridLayout() # Label | field | browse button
+        copy_layout.setContentsMargins(0, 0, 0, 0) # The group box already insets its contents
+        copy_layout.setSpacing(10) # Spacing within the grid
+        copy_layout.setColumnStretch(1, 1) # Fields take the available horizontal space
 
         self.copy_source_edit = QLineEdit()
         self.copy_source_edit.setPlaceholderText("Select directory to snapshot...")
-        copy_layout.addRow("Source Directory:", self._create_browse_row(
-            self.copy_source_edit, self._browse_copy_source, icon=self.icon_folder_open, tooltip="Select Source Directory"))
+        self.browse_copy_source_btn = self._add_browse_row(
+            copy_layout, 0, "Source Directory:", self.copy_source_edit, self._browse_copy_source,
+            icon=self.icon_folder_open, tooltip="Select Source Directory")
 
         self.copy_json_edit = QLineEdit()
         self.copy_json_edit.setPlaceholderText("Select location to save snapshot JSON...")
-        copy_layout.addRow("Snapshot JSON File:", self._create_browse_row(
-            self.copy_json_edit, self._browse_copy_json_save, icon=self.icon_save, tooltip="Select Snapshot Save Location"))
+        self.browse_copy_json_btn = self._add_browse_row(
+            copy_layout, 1, "Snapshot JSON File:", self.copy_json_edit, self._browse_copy_json_save,
+            icon=self.icon_save, tooltip="Select Snapshot Save Location")
 
         # Extensions UI
         self.ext_list = QListWidget()
         self.ext_list.setToolTip("Files with these extensions will be included in the snapshot.")
         self.ext_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection) # Allow multi-select
-        copy_layout.addRow("Include Extensions:", self.ext_list)
+        copy_layout.addWidget(QLabel("Include Extensions:"), 2, 0, Qt.AlignmentFlag.AlignTop)
+        copy_layout.addWidget(self.ext_list, 2, 1, 1, 2)
 
         ext_control_layout = QHBoxLayout()
         self.ext_edit = QLineEdit()
@@ -716,47 +1033,64 @@ class View(QWidget):
         ext_control_layout.addWidget(self.ext_edit, 1) # Stretch line edit
 
         self.add_ext_btn = QPushButton("Add")
+        self.add_ext_btn.setObjectName("AddExtButton") # Object name used by the stylesheet
         self.add_ext_btn.setIcon(self.icon_add)
         self.add_ext_btn.setToolTip("Add the extension typed above.")
         ext_control_layout.addWidget(self.add_ext_btn)
 
         self.remove_ext_btn = QPushButton("Remove")
+        self.remove_ext_btn.setObjectName("RemoveExtButton")
         self.remove_ext_btn.setIcon(self.icon_remove)
         self.remove_ext_btn.setToolTip("Remove selected extensions from the list.")
         ext_control_layout.addWidget(self.remove_ext_btn)
-        copy_layout.addRow(ext_control_layout) # Add the HBox layout as a row
+        copy_layout.addLayout(ext_control_layout, 3, 0, 1, 3) # Add the HBox layout spanning all columns
 
         self.copy_btn = QPushButton("Create Snapshot")
+        self.copy_btn.setObjectName("CopyButton")
         self.copy_btn.setIcon(self.icon_copy)
         self.copy_btn.setToolTip("Scan source directory and save snapshot to JSON.")
-        copy_layout.addRow(self.copy_btn) # Add button spanning columns
-
-        copy_group.setLayout(copy_layout)
+        copy_layout.addWidget(self.copy_btn, 4, 0, 1, 3) # Add button spanning columns
+
+        # Host widget for the whole form, so the section can be disabled in one call
+        self._copy_form_host = QWidget()
+        self._copy_form_host.setLayout(copy_layout)
+        copy_group_layout = QVBoxLayout(copy_group)
+        copy_group_layout.setContentsMargins(0, 0, 0, 0)
+        copy_group_layout.addWidget(self._copy_form_host)
         main_layout.addWidget(copy_group)
         # --- End Copy Section ---
 
 
         # --- Paste Section ---
         paste_group = QGroupBox("2. Recreate from Snapshot (Paste)")
-        paste_layout = QFormLayout()
+        paste_layout = QGridLayout()
+        paste_layout.setContentsMargins(0, 0, 0, 0)
         paste_layout.setSpacing(10)
+        paste_layout.setColumnStretch(1, 1)
 
         self.paste_json_edit = QLineEdit()
         self.paste_json_edit.setPlaceholderText("Select snapshot JSON file to load...")
-        paste_layout.addRow("Snapshot JSON File:", self._create_browse_row(
-            self.paste_json_edit, self._browse_paste_json_open, icon=self.icon_open, tooltip="Select Snapshot File to Load"))
+        self.browse_paste_json_btn = self._add_browse_row(
+            paste_layout, 0, "Snapshot JSON File:", self.paste_json_edit, self._browse_paste_json_open,
+            icon=self.icon_open, tooltip="Select Snapshot File to Load")
 
         self.paste_output_edit = QLineEdit()
         self.paste_output_edit.setPlaceholderText("Select directory to recreate files into...")
-        paste_layout.addRow("Output Directory:", self._create_browse_row(
-            self.paste_output_edit, self._browse_paste_output, icon=self.icon_folder_open, tooltip="Select Output Directory"))
+        self.browse_paste_output_btn = self._add_browse_row(
+            paste_layout, 1, "Output Directory:", self.paste_output_edit, self._browse_paste_output,
+            icon=self.icon_folder_open, tooltip="Select Output Directory")
 
         self.paste_btn = QPushButton("Recreate Files")
+        self.paste_btn.setObjectName("PasteButton")
         self.paste_btn.setIcon(self.icon_paste)
         self.paste_btn.setToolTip("Recreate directory structure and files from the selected snapshot JSON.")
-        paste_layout.addRow(self.paste_btn) # Add button spanning columns
+        paste_layout.addWidget(self.paste_btn, 2, 0, 1, 3) # Add button spanning columns
 
-        paste_group.setLayout(paste_layout)
+        self._paste_form_host = QWidget()
+        self._paste_form_host.setLayout(paste_layout)
+        paste_group_layout = QVBoxLayout(paste_group)
+        paste_group_layout.setContentsMargins(0, 0, 0, 0)
+        paste_group_layout.addWidget(self._paste_form_host)
         main_layout.addWidget(paste_group)
         # --- End Paste Section ---
 
@@ -777,6 +1111,7 @@ class View(QWidget):
         self.log = QTextEdit()
         self.log.setReadOnly(True)
         self.log.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth) # Wrap long lines
+        self.log.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log)
         log_group.setLayout(log_layout)
         # Add stretch factor so log area takes up remaining vertical space
@@ -790,8 +1125,26 @@ class View(QWidget):
         main_layout.addWidget(self.status_bar)
         # --- End Status Bar ---
 
+    @classmethod
+    def _icons(cls, style):
+        """
+        Returns the standard icons used by the View, resolving them through the
+        style only once and sharing the QIcon handles across View instances.
+        """
+        if not cls._ICON_CACHE:
+            for pixmap in cls._ICON_PIXMAPS:
+                cls._ICON_CACHE[pixmap] = style.standardIcon(pixmap)
+        return cls._ICON_CACHE
+
     def apply_styles(self):
         """Apply custom stylesheets for a more modern look."""
+        # Object names are assigned in init_ui, so a single polish pass picks them up
+        self.setStyleSheet(self._stylesheet())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _stylesheet():
+        """Builds the stylesheet text once; later Views reuse the cached string."""
         # Color Palette (adjust as desired)
         primary_color = "#007ACC" # Brighter Blue
         secondary_color = "#6c757d" # Gray
@@ -804,7 +1157,7 @@ class View(QWidget):
         border_color = "#ced4da"
         group_bg_color = "#ffffff" # White background for group boxes
 
-        self.setStyleSheet(f"""
+        return f"""
             QWidget {{
                 font-family: Segoe UI, Arial, sans-serif;
                 font-size: 10pt;
@@ -920,22 +1273,18 @@ class View(QWidget):
                 padding: 4px;
                 border-radius: 3px;
             }}
-        """)
-        # Set object names for specific styling and easier identification
-        self.copy_btn.setObjectName("CopyButton")
-        self.paste_btn.setObjectName("PasteButton")
-        self.add_ext_btn.setObjectName("AddExtButton")
-        self.remove_ext_btn.setObjectName("RemoveExtButton")
+        """
 
 
-    def _create_browse_row(self, line_edit, handler, icon=None, tooltip="Browse..."):
-        """Helper to create a row with a LineEdit and an icon Browse button."""
-        row_widget = QWidget() # Container widget for the row
-        row_layout = QHBoxLayout(row_widget)
-        row_layout.setContentsMargins(0,0,0,0) # No internal margins for the HBox
-        row_layout.setSpacing(5) # Spacing between line edit and button
+    def _add_browse_row(self, grid, row, label, line_edit, handler, icon=None, tooltip="Browse..."):
+        """
+        Helper to place a label, a LineEdit and an icon Browse button on one grid row.
 
-        row_layout.addWidget(line_edit, 1) # LineEdit takes available horizontal space
+        Returns:
+            QPushButton: The browse button (kept for enable/disable).
+        """
+        grid.addWidget(QLabel(label), row, 0)
+        grid.addWidget(line_edit, row, 1) # LineEdit column stretches
 
         btn = QPushButton()
         if icon:
@@ -945,22 +1294,25 @@ class View(QWidget):
         btn.setToolTip(tooltip) # Set tooltip for the button
         btn.setFixedSize(btn.iconSize().width() + 18, btn.iconSize().height() + 10) # Adjust size for icon padding
         btn.clicked.connect(handler)
-        row_layout.addWidget(btn)
+        grid.addWidget(btn, row, 2)
 
-        return row_widget # Return the container widget
+        return btn
 
 
     def connect_signals(self):
         """Connect signals from UI elements to ViewModel slots and vice-versa."""
         # --- View -> ViewModel ---
-        # Connect textChanged signals to the NEW explicit ViewModel slots
-        self.copy_source_edit.textChanged.connect(self.viewmodel.set_copy_source_dir)
-        self.copy_json_edit.textChanged.connect(self.viewmodel.set_copy_json_path)
-        self.paste_json_edit.textChanged.connect(self.viewmodel.set_paste_json_path)
-        self.paste_output_edit.textChanged.connect(self.viewmodel.set_paste_output_dir)
+        # Typed text is assigned to the ViewModel properties through a debounce timer
+        self._bind_line_edit(self.copy_source_edit, functools.partial(setattr, self.viewmodel, "copy_source_dir"))
+        self._bind_line_edit(self.copy_json_edit, functools.partial(setattr, self.viewmodel, "copy_json_path"))
+        self._bind_line_edit(self.paste_json_edit, functools.partial(setattr, self.viewmodel, "paste_json_path"))
+        self._bind_line_edit(self.paste_output_edit, functools.partial(setattr, self.viewmodel, "paste_output_dir"))
 
         # Connect button clicks to ViewModel actions
+        # (pending edits are committed first so the action never sees stale paths)
+        self.copy_btn.clicked.connect(self._commit_pending_edits)
         self.copy_btn.clicked.connect(self.viewmodel.perform_copy)
+        self.paste_btn.clicked.connect(self._commit_pending_edits)
         self.paste_btn.clicked.connect(self.viewmodel.perform_paste)
         self.add_ext_btn.clicked.connect(self._add_extension)
         self.remove_ext_btn.clicked.connect(self._remove_extensions)
@@ -973,18 +1325,51 @@ class View(QWidget):
         self.viewmodel.message_logged.connect(self._log_message) # Use custom slot for formatting
         self.viewmodel.status_update.connect(self._show_status_message)
         self.viewmodel.extensions_changed.connect(self._update_extensions_list)
-        self.viewmodel.progress_changed.connect(self.progress_bar.setValue)
+        self.viewmodel.progress_changed.connect(self._on_progress) # Throttled while an operation runs
         self.viewmodel.progress_max_changed.connect(self.progress_bar.setMaximum)
         self.viewmodel.operation_active.connect(self._set_operation_active_state) # Handle UI enabling/disabling
+        self.viewmodel.confirm_create_dir_requested.connect(self._confirm_create_dir)
+
+    def _bind_line_edit(self, line_edit, setter):
+        """
+        Forwards a LineEdit's text to a ViewModel setter, debounced.
+
+        Every keystroke restarts a single-shot timer, so a burst of typing results
+        in one setter call. Losing focus (editingFinished) commits immediately.
+
+        Args:
+            line_edit (QLineEdit): The input field to bind.
+            setter (callable): Callable receiving the text (e.g. a ViewModel property assignment).
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.TEXT_COMMIT_DELAY_MS)
+
+        def commit():
+            timer.stop()
+            setter(line_edit.text())
+
+        timer.timeout.connect(commit)
+        line_edit.textChanged.connect(lambda _text: timer.start()) # (Re)start the countdown
+        line_edit.editingFinished.connect(commit)
+        self._edit_commits.append((timer, commit))
+
+    def _commit_pending_edits(self):
+        """Immediately pushes any text still waiting on a debounce timer to the ViewModel."""
+        for timer, commit in self._edit_commits:
+            if timer.isActive():
+                commit()
 
 
     def load_initial_data(self):
         """Populates the UI fields with data from the ViewModel on startup."""
-        # Use setText which will trigger textChanged -> ViewModel update via slots
-        self.copy_source_edit.setText(self.viewmodel.copy_source_dir)
-        self.copy_json_edit.setText(self.viewmodel.copy_json_path)
-        self.paste_json_edit.setText(self.viewmodel.paste_json_path)
-        self.paste_output_edit.setText(self.viewmodel.paste_output_dir)
+        # The values come from the ViewModel, so block textChanged to avoid pushing them straight back
+        for edit, value in ((self.copy_source_edit, self.viewmodel.copy_source_dir),
+                            (self.copy_json_edit, self.viewmodel.copy_json_path),
+                            (self.paste_json_edit, self.viewmodel.paste_json_path),
+                            (self.paste_output_edit, self.viewmodel.paste_output_dir)):
+            with QSignalBlocker(edit):
+                edit.setText(value)
         # Update the extensions list display
         self._update_extensions_list(self.viewmodel.extensions)
         # Set initial status bar message
@@ -997,7 +1382,7 @@ class View(QWidget):
         """Opens a dialog to select the source directory for copying."""
         # Start browsing from the current path or user's home directory
         start_dir = self.viewmodel.copy_source_dir or os.path.expanduser("~")
-        directory = QFileDialog.getExistingDirectory(self, "Select Source Directory", start_dir)
+        directory = self._pick_directory("Select Source Directory", start_dir)
         if directory:
             # Update the LineEdit; textChanged signal will update the ViewModel
             self.copy_source_edit.setText(directory)
@@ -1025,10 +1410,29 @@ class View(QWidget):
     def _browse_paste_output(self):
         """Opens a dialog to select the output directory for recreation."""
         start_dir = self.viewmodel.paste_output_dir or os.path.expanduser("~")
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory", start_dir)
+        directory = self._pick_directory("Select Output Directory", start_dir)
         if directory:
             # Update the LineEdit; textChanged signal updates ViewModel
             self.paste_output_edit.setText(directory)
+
+    def _pick_directory(self, title, start_dir):
+        """
+        Opens a lightweight directory-only picker and returns the chosen path ('' if cancelled).
+
+        Qt's own dialog is used (instead of the native one) so it can be restricted to
+        directories, skip symlink resolution and use a fixed folder icon; together these
+        avoid stat()ing and icon-probing every entry, which is slow on large or remote trees.
+        """
+        dialog = QFileDialog(self, title, start_dir)
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOptions(QFileDialog.Option.ShowDirsOnly
+                          | QFileDialog.Option.DontResolveSymlinks
+                          | QFileDialog.Option.DontUseNativeDialog)
+        dialog.setIconProvider(self._dir_icon_provider) # Not owned by the dialog; kept alive on self
+        if dialog.exec() != QFileDialog.DialogCode.Accepted:
+            return ""
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else ""
     # --- End Browse Handlers ---
 
 
@@ -1039,13 +1443,19 @@ class View(QWidget):
         ext = self.ext_edit.text().strip()
         if not ext: return # Ignore empty input
 
-        # Basic validation: must start with '.'
-        if not ext.startswith('.'):
-            QMessageBox.warning(self, "Invalid Extension", "Extension must start with a dot (e.g., .txt, .py)")
+        # Validation (leading dot included) is a single precompiled match; no modal on rejects
+        if not EXTENSION_PATTERN.match(ext):
+            self._show_status_message("Invalid extension. Use a leading dot, e.g. .txt or .py", 2000)
+            return
+
+        ext = ext.lower() # Extensions are stored in lowercase
+        if ext in self._ext_set: # Already listed; skip the ViewModel round trip
+            self._show_status_message(f"Extension '{ext}' already exists.", 1500)
+            self.ext_edit.clear()
             return
 
         # Call ViewModel method to add the extension
-        self.viewmodel.add_extension(ext.lower()) # Add in lowercase
+        self.viewmodel.add_extension(ext)
         self.ext_edit.clear() # Clear input field after adding
 
     def _remove_extensions(self):
@@ -1055,62 +1465,119 @@ class View(QWidget):
             self._show_status_message("No extensions selected to remove.", 2000)
             return
 
-        # Confirm removal with the user
-        reply = QMessageBox.question(self, 'Confirm Removal',
-                                       f"Remove {len(selected_items)} selected extension(s)?",
-                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                       QMessageBox.StandardButton.No) # Default to No
+        # Confirm bulk removals with the user; a single item is removed straight away
+        if len(selected_items) > 1:
+            if self._confirm_remove_box(len(selected_items)).exec() != QMessageBox.StandardButton.Yes:
+                return
+
+        # One ViewModel call, so the list is refreshed once rather than per item
+        self.viewmodel.remove_extensions([item.text() for item in selected_items])
 
-        if reply == QMessageBox.StandardButton.Yes:
-            for item in selected_items:
-                # Call ViewModel method to remove each selected extension
-                self.viewmodel.remove_extension(item.text())
+    def _confirm_remove_box(self, count):
+        """Returns the (lazily created, reused) confirmation box for removing `count` extensions."""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(QMessageBox.Icon.Question, 'Confirm Removal', "",
+                                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                            self)
+        self._confirm_box.setText(f"Remove {count} selected extension(s)?")
+        self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No) # Default to No
+        return self._confirm_box
 
     @Slot(list) # Explicitly define as slot receiving a list
     def _update_extensions_list(self, extensions):
-        """Updates the QListWidget with the current list of extensions."""
-        self.ext_list.clear() # Remove existing items
-        self.ext_list.addItems(sorted(extensions)) # Add sorted items
+        """
+        Updates the QListWidget with the current list of extensions.
+
+        Only rows that actually changed are touched, so existing items (and their
+        selection state) survive and the list is repainted once per update.
+        """
+        new_set = set(extensions)
+        to_add = new_set - self._ext_set
+        to_remove = self._ext_set - new_set
+        if not to_add and not to_remove:
+            return
+
+        self.ext_list.setUpdatesEnabled(False) # Batch the repaint
+        self.ext_list.blockSignals(True)
+        try:
+            # Walk backwards so takeItem() doesn't shift rows still to be visited
+            for row in range(self.ext_list.count() - 1, -1, -1):
+                if self.ext_list.item(row).text() in to_remove:
+                    self.ext_list.takeItem(row)
+            self.ext_list.addItems(sorted(to_add))
+            self.ext_list.sortItems()
+        finally:
+            self.ext_list.blockSignals(False)
+            self.ext_list.setUpdatesEnabled(True)
+        self._ext_set = new_set
     # --- End Extension Handlers ---
 
     # --- UI Update Slots ---
 
     @Slot(str)
     def _log_message(self, message):
-        """Appends a message to the log QTextEdit, ensuring it scrolls to the bottom."""
-        self.log.append(message)
+        """Queues a message for the log QTextEdit; queued messages are written in batches."""
         # Optional: Add timestamp or formatting here if desired
-        # self.log.append(f"[{datetime.datetime.now():%H:%M:%S}] {message}")
-        self.log.ensureCursorVisible() # Auto-scroll to the latest message
+        # message = f"[{datetime.datetime.now():%H:%M:%S}] {message}"
+        self._log_queue.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Writes all queued messages to the log in one insert and scrolls to the bottom."""
+        if not self._log_queue:
+            self._log_timer.stop() # Nothing arrived since the last flush; go idle
+            return
+        text = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        if not self.log.document().isEmpty():
+            text = "\n" + text # Start a new line, as QTextEdit.append would
+
+        self.log.setUpdatesEnabled(False)
+        self._log_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._log_cursor.insertText(text)
+        scroll_bar = self.log.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum()) # Auto-scroll to the latest message
+        self.log.setUpdatesEnabled(True)
+
+    @Slot(int)
+    def _on_progress(self, value):
+        """Records a progress value; during an operation the refresh timer paints it."""
+        self._pending_progress = value
+        if not self._progress_timer.isActive():
+            self._refresh_progress() # Idle (e.g. post-operation reset): apply immediately
+
+    def _refresh_progress(self):
+        """Pushes the latest progress value to the progress bar if it changed."""
+        if self.progress_bar.value() != self._pending_progress:
+            self.progress_bar.setValue(self._pending_progress)
 
     @Slot(str, int)
     def _show_status_message(self, message, timeout):
         """Shows a message in the status bar for a specified duration (milliseconds)."""
         self.status_bar.showMessage(message, timeout)
 
+    @Slot(str)
+    def _confirm_create_dir(self, path):
+        """Asks whether to create a missing paste output directory and reports the answer."""
+        reply = QMessageBox.question(self, "Create Directory?",
+                                     f"The output directory does not exist:\n{path}\n\nDo you want to create it?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.No)
+        self.viewmodel.on_create_dir_answered(reply == QMessageBox.StandardButton.Yes)
+
     @Slot(bool)
     def _set_operation_active_state(self, active):
         """Enables/disables UI elements based on whether an operation is running."""
         self.progress_bar.setVisible(active)
-        # Disable buttons and input fields during operation
-        self.copy_source_edit.setEnabled(not active)
-        self.copy_json_edit.setEnabled(not active)
-        # Find browse buttons associated with line edits and disable them
-        # (This assumes the browse button is the sibling widget in the layout)
-        self.copy_source_edit.parentWidget().findChild(QPushButton).setEnabled(not active)
-        self.copy_json_edit.parentWidget().findChild(QPushButton).setEnabled(not active)
-
-        self.ext_list.setEnabled(not active)
-        self.ext_edit.setEnabled(not active)
-        self.add_ext_btn.setEnabled(not active)
-        self.remove_ext_btn.setEnabled(not active)
-        self.copy_btn.setEnabled(not active)
-
-        self.paste_json_edit.setEnabled(not active)
-        self.paste_output_edit.setEnabled(not active)
-        self.paste_json_edit.parentWidget().findChild(QPushButton).setEnabled(not active)
-        self.paste_output_edit.parentWidget().findChild(QPushButton).setEnabled(not active)
-        self.paste_btn.setEnabled(not active)
+        if active:
+            self._progress_timer.start()
+        else:
+            self._progress_timer.stop()
+            self._refresh_progress() # Final paint with the last reported value
+        # Disable buttons and input fields during operation; children follow their form host
+        self._copy_form_host.setEnabled(not active)
+        self._paste_form_host.setEnabled(not active)
 
         # Change cursor to busy if active, otherwise default
         if active:
@@ -1154,6 +1621,7 @@ def main():
     viewmodel = ViewModel(model)
     view = View(viewmodel)
     view.show() # Display the main window
+    app.aboutToQuit.connect(viewmodel.shutdown) # Persist pending settings and stop the writer thread
 
     # --- Start the Qt event loop ---
     sys.exit(app.exec())
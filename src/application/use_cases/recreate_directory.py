@@ -40,16 +40,23 @@ class RecreateDirectoryUseCase:
         # Ensure output directory exists
         self._file_system.create_directory(output_path)
         
-        # Create all subdirectories
+        # Create every needed directory exactly once (snapshot dirs plus file parents),
+        # shallowest first, so file writes below can skip their own makedirs
+        snapshot_dirs = {directory.relative_path for directory in snapshot.directories}
+        needed_dirs = snapshot_dirs | {
+            os.path.dirname(file_entry.relative_path) for file_entry in snapshot.files
+        }
+        needed_dirs.discard('')
         dir_count = 0
-        for directory in snapshot.directories:
-            dir_path = os.path.join(output_path, directory.relative_path.replace('/', os.sep))
+        for rel_dir in sorted(needed_dirs, key=lambda d: (d.count('/'), d)):
+            dir_path = os.path.join(output_path, rel_dir.replace('/', os.sep))
             try:
                 self._file_system.create_directory(dir_path)
-                dir_count += 1
+                if rel_dir in snapshot_dirs:
+                    dir_count += 1
             except FileSystemError as e:
                 if request.log_callback:
-                    request.log_callback(f"  [Error creating dir {directory.relative_path}] -> {e}")
+                    request.log_callback(f"  [Error creating dir {rel_dir}] -> {e}")
         
         # Recreate all files
         total_files = snapshot.get_file_count()
@@ -66,8 +73,8 @@ class RecreateDirectoryUseCase:
                     file_entry.relative_path.replace('/', os.sep)
                 )
                 
-                # Write file content
-                self._file_system.write_file(file_path, file_entry.content)
+                # Write file content (parent directories already exist)
+                self._file_system.write_file(file_path, file_entry.content, create_parents=False)
                 
                 processed += 1
                 
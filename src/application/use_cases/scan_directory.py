@@ -1,6 +1,8 @@
 """Scan directory use case."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
 from ...domain.models.snapshot import DirectorySnapshot
@@ -16,6 +18,9 @@ from ..dto.scan_request import ScanRequest
 class ScanDirectoryUseCase:
     """Use case for scanning a directory and creating a snapshot."""
     
+    # File reads are I/O-bound (open/read release the GIL), so more workers than cores pays off
+    MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(
         self,
         file_system: IFileSystemService,
@@ -64,49 +69,53 @@ class ScanDirectoryUseCase:
         if request.log_callback:
             request.log_callback(f"🔢 Found {len(file_paths)} files matching extensions.")
         
+        # Relative paths computed once, reused for directories and file entries
+        rel_paths = [
+            get_relative_path(file_path, request.root_path)
+            for file_path in file_paths
+        ]
+        
         # Collect directories from file paths
         directories_set = set()
-        for file_path in file_paths:
-            rel_path = get_relative_path(file_path, request.root_path)
+        for rel_path in rel_paths:
             dir_path = os.path.dirname(rel_path)
             
-            # Add all parent directories
-            while dir_path and dir_path != '.':
-                directories_set.add(dir_path)
+            # Add all parent directories (stop at one already seen: its parents are in too).
+            # Interned: many files share each directory, so one string serves them all
+            while dir_path and dir_path != '.' and dir_path not in directories_set:
+                directories_set.add(sys.intern(dir_path))
                 dir_path = os.path.dirname(dir_path)
         
         # Add directories to snapshot
         for dir_path in sorted(directories_set):
             snapshot.add_directory(dir_path)
         
-        # Process files
+        # Process files: read/hash/encode on a thread pool, collect in order on this thread
         total_files = len(file_paths)
-        for idx, file_path in enumerate(file_paths, 1):
-            try:
-                # Read file content
-                content = self._file_system.read_file(file_path)
-                
-                # Create file entry
-                rel_path = get_relative_path(file_path, request.root_path)
-                file_entry = FileEntry(relative_path=rel_path, content=content)
-                
-                # Encode content for storage
-                encoded = self._encoder.encode(content)
-                file_entry.set_encoded_content(encoded)
-                
-                # Add to snapshot
-                snapshot.add_file(file_entry)
-                
-                if request.log_callback:
-                    request.log_callback(f"  [Encode {idx}/{total_files}] -> {rel_path}")
-                
-                if request.progress_callback:
-                    request.progress_callback(idx, total_files)
+        with ThreadPoolExecutor(max_workers=self.MAX_READ_WORKERS) as executor:
+            futures = [
+                executor.submit(self._read_and_encode, file_path, rel_path)
+                for file_path, rel_path in zip(file_paths, rel_paths)
+            ]
+            for idx, (file_path, future) in enumerate(zip(file_paths, futures), 1):
+                try:
+                    file_entry = future.result()
+                    
+                    # Add to snapshot
+                    snapshot.add_file(file_entry)
                     
-            except Exception as e:
-                if request.log_callback:
-                    request.log_callback(f"  [Error reading {file_path}] -> {e}")
-                # Continue processing other files
+                    if request.log_callback:
+                        request.log_callback(
+                            f"  [Encode {idx}/{total_files}] -> {file_entry.relative_path}"
+                        )
+                    
+                    if request.progress_callback:
+                        request.progress_callback(idx, total_files)
+                        
+                except Exception as e:
+                    if request.log_callback:
+                        request.log_callback(f"  [Error reading {file_path}] -> {e}")
+                    # Continue processing other files
         
         if request.log_callback:
             request.log_callback(
@@ -115,3 +124,19 @@ class ScanDirectoryUseCase:
             )
         
         return snapshot
+    
+    def _read_and_encode(self, file_path: str, rel_path: str) -> FileEntry:
+        """
+        Read one file and build its encoded entry (runs on a worker thread).
+        
+        Args:
+            file_path: Absolute path of the file to read.
+            rel_path: The entry's '/'-separated path relative to the scan root.
+            
+        Returns:
+            FileEntry with checksum and encoded content set.
+        """
+        content = self._file_system.read_file(file_path)
+        file_entry = FileEntry(relative_path=rel_path, content=content)
+        file_entry.set_encoded_content(self._encoder.encode(content))
+        return file_entry
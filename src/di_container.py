@@ -12,6 +12,14 @@ from .infrastructure.encoding.base64_encoder import Base64Encoder
 from .infrastructure.encryption.aes_gcm_encryptor import AESGCMEncryptor
 from .infrastructure.file_system.file_system_service import FileSystemService
 from .infrastructure.persistence.json_repository import JsonSnapshotRepository
+from .infrastructure.persistence.msgpack_repository import (
+    MsgpackSnapshotRepository,
+    is_binary_snapshot_path
+)
+from .infrastructure.persistence.two_file_repository import (
+    TwoFileSnapshotRepository,
+    is_two_file_snapshot_path
+)
 from .infrastructure.persistence.settings_repository import SettingsRepository
 
 from .application.use_cases.scan_directory import ScanDirectoryUseCase
@@ -30,6 +38,8 @@ class DIContainer:
         self._encryption_service: Optional[IEncryptionService] = None
         self._file_system: Optional[IFileSystemService] = None
         self._snapshot_repository: Optional[ISnapshotRepository] = None
+        self._binary_snapshot_repository: Optional[ISnapshotRepository] = None
+        self._two_file_snapshot_repository: Optional[ISnapshotRepository] = None
         self._settings_repository: Optional[SettingsRepository] = None
         
         # Domain services
@@ -55,8 +65,25 @@ class DIContainer:
             self._encryption_service = AESGCMEncryptor()
         return self._encryption_service
     
-    def get_snapshot_repository(self) -> ISnapshotRepository:
-        """Get snapshot repository instance."""
+    def get_snapshot_repository(self, path: Optional[str] = None) -> ISnapshotRepository:
+        """
+        Get the snapshot repository instance for a snapshot file.
+        
+        Args:
+            path: Optional snapshot path; '.snap' files use the MessagePack format,
+                '.snapidx' files a JSON index plus raw blob, anything else
+                (or no path) uses JSON.
+        """
+        if is_binary_snapshot_path(path):
+            if self._binary_snapshot_repository is None:
+                self._binary_snapshot_repository = MsgpackSnapshotRepository(
+                    self.get_encryption_service()
+                )
+            return self._binary_snapshot_repository
+        if is_two_file_snapshot_path(path):
+            if self._two_file_snapshot_repository is None:
+                self._two_file_snapshot_repository = TwoFileSnapshotRepository()
+            return self._two_file_snapshot_repository
         if self._snapshot_repository is None:
             encoder = self.get_encoder()
             encryption = self.get_encryption_service()
@@ -87,16 +114,16 @@ class DIContainer:
             encoder=self.get_encoder()
         )
     
-    def get_save_snapshot_use_case(self) -> SaveSnapshotUseCase:
-        """Create a new save snapshot use case."""
+    def get_save_snapshot_use_case(self, path: Optional[str] = None) -> SaveSnapshotUseCase:
+        """Create a new save snapshot use case (format chosen by the snapshot path)."""
         return SaveSnapshotUseCase(
-            repository=self.get_snapshot_repository()
+            repository=self.get_snapshot_repository(path)
         )
     
-    def get_load_snapshot_use_case(self) -> LoadSnapshotUseCase:
-        """Create a new load snapshot use case."""
+    def get_load_snapshot_use_case(self, path: Optional[str] = None) -> LoadSnapshotUseCase:
+        """Create a new load snapshot use case (format chosen by the snapshot path)."""
         return LoadSnapshotUseCase(
-            repository=self.get_snapshot_repository()
+            repository=self.get_snapshot_repository(path)
         )
     
     def get_recreate_directory_use_case(self) -> RecreateDirectoryUseCase:
@@ -1,6 +1,7 @@
 """Encryption service interface."""
 
 from abc import ABC, abstractmethod
+from typing import Union
 
 
 class IEncryptionService(ABC):
@@ -24,12 +25,13 @@ class IEncryptionService(ABC):
         pass
     
     @abstractmethod
-    def decrypt(self, encrypted_data: bytes, password: str) -> bytes:
+    def decrypt(self, encrypted_data: Union[bytes, memoryview], password: str) -> bytes:
         """
         Decrypt data using the provided password.
         
         Args:
-            encrypted_data: Encrypted data with metadata.
+            encrypted_data: Encrypted data with metadata (bytes or a zero-copy view,
+                e.g. of an mmap).
             password: Password for decryption.
             
         Returns:
@@ -42,7 +44,7 @@ class IEncryptionService(ABC):
         pass
     
     @abstractmethod
-    def is_encrypted(self, data: bytes) -> bool:
+    def is_encrypted(self, data: Union[bytes, memoryview]) -> bool:
         """
         Check if data is encrypted.
         
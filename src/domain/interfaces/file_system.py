@@ -73,13 +73,14 @@ class IFileSystemService(ABC):
         pass
     
     @abstractmethod
-    def write_file(self, path: str, content: bytes) -> None:
+    def write_file(self, path: str, content: bytes, create_parents: bool = True) -> None:
         """
         Write binary content to a file.
         
         Args:
             path: The file path to write to.
             content: Binary content to write.
+            create_parents: Whether to create missing parent directories first.
             
         Raises:
             FileSystemError: If file writing fails.
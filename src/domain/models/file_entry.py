@@ -17,12 +17,15 @@ class FileEntry:
     size: int = field(init=False)
     checksum: str = field(init=False)
     _encoded_content: Optional[str] = field(default=None, init=False, repr=False)
+    # (content object, checksum) last proven to match; lets validation skip re-hashing
+    _verified: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Calculate derived fields after initialization."""
         self.relative_path = normalize_path(self.relative_path)
         self.size = len(self.content)
         self.checksum = self._calculate_checksum(self.content)
+        self._remember_verified()
     
     @staticmethod
     def _calculate_checksum(content: bytes) -> str:
@@ -36,8 +39,22 @@ class FileEntry:
         Returns:
             True if checksum is valid, False otherwise.
         """
+        # bytes are immutable: the same object with the same stored checksum cannot have changed
+        if self._verified is not None:
+            verified_content, verified_checksum = self._verified
+            if self.content is verified_content and self.checksum == verified_checksum:
+                return True
+        
         current_checksum = self._calculate_checksum(self.content)
-        return current_checksum == self.checksum
+        if current_checksum != self.checksum:
+            return False
+        self._remember_verified()
+        return True
+    
+    def _remember_verified(self) -> None:
+        """Record the current content/checksum pair as verified (immutable bytes only)."""
+        if isinstance(self.content, bytes):
+            self._verified = (self.content, self.checksum)
     
     def get_extension(self) -> str:
         """
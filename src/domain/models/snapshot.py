@@ -1,5 +1,6 @@
 """Directory snapshot domain model."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -7,6 +8,7 @@ from typing import List, Dict, Any, Optional
 from .file_entry import FileEntry
 from .directory_entry import DirectoryEntry
 from ...shared.exceptions import ValidationError
+from ...shared.utils import get_file_extension
 
 
 @dataclass
@@ -73,17 +75,16 @@ class DirectorySnapshot:
         if not self.root_path:
             raise ValidationError("Snapshot must have a root_path")
         
-        # Validate all files have valid checksums
+        # Validate checksums and check for duplicate paths in one pass over the files
+        file_paths = set()
         for file_entry in self.files:
             if not file_entry.validate_checksum():
                 raise ValidationError(
                     f"Invalid checksum for file: {file_entry.relative_path}"
                 )
-        
-        # Check for duplicate paths
-        file_paths = [f.relative_path for f in self.files]
-        if len(file_paths) != len(set(file_paths)):
-            raise ValidationError("Snapshot contains duplicate file paths")
+            if file_entry.relative_path in file_paths:
+                raise ValidationError("Snapshot contains duplicate file paths")
+            file_paths.add(file_entry.relative_path)
         
         dir_paths = [d.relative_path for d in self.directories]
         if len(dir_paths) != len(set(dir_paths)):
@@ -143,22 +144,25 @@ class DirectorySnapshot:
         Returns:
             Dictionary containing snapshot statistics.
         """
+        # Pull the two needed columns out once instead of per-entry method calls
+        paths = [f.relative_path for f in self.files]
+        sizes = [f.size for f in self.files]
         return {
             'root_path': self.root_path,
             'created_at': self.created_at.isoformat(),
             'directory_count': self.get_directory_count(),
-            'file_count': self.get_file_count(),
-            'total_size_bytes': self.get_total_size(),
-            'file_extensions': self._get_extension_counts()
+            'file_count': len(paths),
+            'total_size_bytes': sum(sizes),
+            'file_extensions': self._get_extension_counts(paths)
         }
     
-    def _get_extension_counts(self) -> Dict[str, int]:
+    @staticmethod
+    def _get_extension_counts(paths: List[str]) -> Dict[str, int]:
         """Get counts of files by extension."""
-        extension_counts: Dict[str, int] = {}
-        for file in self.files:
-            ext = file.get_extension() or '(no extension)'
-            extension_counts[ext] = extension_counts.get(ext, 0) + 1
-        return extension_counts
+        counts = Counter(map(get_file_extension, paths))
+        if '' in counts:
+            counts['(no extension)'] = counts.pop('')
+        return dict(counts)
     
     def __str__(self) -> str:
         return (f"Snapshot(root='{self.root_path}', "
@@ -1,8 +1,12 @@
 """AES-256-GCM encryption implementation."""
 
+import hashlib
 import secrets
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Union
 
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
@@ -34,6 +38,15 @@ class AESGCMEncryptor(IEncryptionService):
     NONCE_SIZE = 12  # 96 bits (recommended for GCM)
     KEY_SIZE = 32  # 256 bits for AES-256
     PBKDF2_ITERATIONS = 100000  # OWASP recommendation (2023)
+    KEY_CACHE_SIZE = 8  # Derived keys kept in memory (per instance, never persisted)
+    STREAM_CHUNK_SIZE = 1024 * 1024  # Plaintext read per step by encrypt_stream
+    
+    def __init__(self):
+        """Initialize the encryptor with an empty derived-key cache."""
+        # (salt, SHA-256 of password) -> derived key, least recently used first.
+        # Lets re-loading a file (or retrying after a wrong password) skip PBKDF2.
+        self._key_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._key_cache_lock = threading.Lock()
     
     def encrypt(self, data: bytes, password: str) -> bytes:
         """
@@ -79,12 +92,50 @@ class AESGCMEncryptor(IEncryptionService):
         except Exception as e:
             raise EncryptionError(f"Encryption failed: {str(e)}")
     
-    def decrypt(self, encrypted_data: bytes, password: str) -> bytes:
+    def encrypt_stream(self, source: BinaryIO, destination: BinaryIO, password: str) -> None:
+        """
+        Encrypt a binary stream chunk by chunk into another stream.
+        
+        Writes the same format as encrypt() (decrypt() reads it back), but only
+        STREAM_CHUNK_SIZE bytes of plaintext are held in memory at a time.
+        
+        Args:
+            source: Readable binary stream with the data to encrypt.
+            destination: Writable binary stream for the encrypted output.
+            password: Password for encryption.
+        
+        Raises:
+            EncryptionError: If encryption fails.
+        """
+        try:
+            salt = self._generate_salt()
+            nonce = self._generate_nonce()
+            key = self._derive_key(password, salt)
+            
+            # The low-level GCM cipher supports incremental update(); its output
+            # followed by the tag is exactly what AESGCM.encrypt() returns
+            encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+            
+            destination.write(self.MAGIC_HEADER + bytes([self.VERSION]) + salt + nonce)
+            while True:
+                chunk = source.read(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                destination.write(encryptor.update(chunk))
+            destination.write(encryptor.finalize())
+            destination.write(encryptor.tag)
+            
+        except EncryptionError:
+            raise
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {str(e)}")
+    
+    def decrypt(self, encrypted_data: Union[bytes, memoryview], password: str) -> bytes:
         """
         Decrypt data using AES-256-GCM with password-based key.
         
         Args:
-            encrypted_data: Encrypted data in custom format.
+            encrypted_data: Encrypted data in custom format (bytes or a zero-copy view).
             password: Password for decryption.
             
         Returns:
@@ -136,14 +187,15 @@ class AESGCMEncryptor(IEncryptionService):
             if len(nonce) != self.NONCE_SIZE:
                 raise DecryptionError("Invalid encrypted data: incomplete nonce")
             
-            # Extract ciphertext (includes authentication tag)
-            ciphertext = encrypted_data[offset:]
+            # Extract ciphertext (includes authentication tag) as a zero-copy view;
+            # AESGCM (OpenSSL, AES-NI/CLMUL accelerated) accepts any buffer
+            ciphertext = memoryview(encrypted_data)[offset:]
             
             if len(ciphertext) < 16:  # Minimum: empty data + 16-byte tag
                 raise DecryptionError("Invalid encrypted data: incomplete ciphertext")
             
-            # Derive key from password
-            key = self._derive_key(password, salt)
+            # Derive key from password (salt as bytes: it keys the cache and feeds PBKDF2)
+            key = self._derive_key(password, bytes(salt))
             
             # Decrypt with AES-GCM (automatically verifies authentication tag)
             aesgcm = AESGCM(key)
@@ -163,7 +215,7 @@ class AESGCMEncryptor(IEncryptionService):
         except Exception as e:
             raise DecryptionError(f"Decryption failed: {str(e)}")
     
-    def is_encrypted(self, data: bytes) -> bool:
+    def is_encrypted(self, data: Union[bytes, memoryview]) -> bool:
         """
         Check if data is encrypted by verifying magic header and version.
         
@@ -176,7 +228,8 @@ class AESGCMEncryptor(IEncryptionService):
         if not data or len(data) < len(self.MAGIC_HEADER) + 1:  # +1 for version
             return False
         
-        if not data.startswith(self.MAGIC_HEADER):
+        # Slice-compare instead of startswith() so memoryviews work as well
+        if bytes(data[:len(self.MAGIC_HEADER)]) != self.MAGIC_HEADER:
             return False
         
         # Check version
@@ -194,6 +247,15 @@ class AESGCMEncryptor(IEncryptionService):
         Returns:
             Derived encryption key.
         """
+        password_bytes = password.encode('utf-8')
+        # Key on a digest so the cache never holds the password itself
+        cache_key = (salt, hashlib.sha256(password_bytes).digest())
+        with self._key_cache_lock:
+            key = self._key_cache.get(cache_key)
+            if key is not None:
+                self._key_cache.move_to_end(cache_key)
+                return key
+        
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=self.KEY_SIZE,
@@ -201,7 +263,14 @@ class AESGCMEncryptor(IEncryptionService):
             iterations=self.PBKDF2_ITERATIONS,
             backend=default_backend()
         )
-        return kdf.derive(password.encode('utf-8'))
+        key = kdf.derive(password_bytes)
+        
+        with self._key_cache_lock:
+            self._key_cache[cache_key] = key
+            self._key_cache.move_to_end(cache_key)
+            while len(self._key_cache) > self.KEY_CACHE_SIZE:
+                self._key_cache.popitem(last=False)
+        return key
     
     def _generate_salt(self) -> bytes:
         """Generate cryptographically secure random salt."""
@@ -1,12 +1,15 @@
 """File system service implementation."""
 
 import os
-from typing import List, Callable, Optional
+from typing import Iterator, List, Callable, Optional
 
 from ...domain.interfaces.file_system import IFileSystemService
 from ...shared.exceptions import FileSystemError
 from ...shared.utils import get_file_extension
 
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
 
 class FileSystemService(IFileSystemService):
     """Concrete implementation of file system operations."""
@@ -53,38 +56,25 @@ class FileSystemService(IFileSystemService):
         if not self.directory_exists(root_path):
             raise FileSystemError(f"Directory does not exist: {root_path}")
         
-        # Normalize extensions to lowercase
-        extensions_lower = [ext.lower() for ext in extensions]
-        
-        matching_files: List[str] = []
+        # Normalize extensions to lowercase once; a set makes each per-file check O(1)
+        # instead of a scan over the extension list
+        extensions_lower = frozenset(ext.lower() for ext in extensions)
         
         try:
-            # First pass: count total files for progress
-            total_files = 0
-            if progress_callback:
-                for _, _, filenames in os.walk(root_path):
-                    for filename in filenames:
-                        ext = get_file_extension(filename)
-                        if ext in extensions_lower:
-                            total_files += 1
-                progress_callback(0, total_files)
-            
-            # Second pass: collect matching files
-            processed = 0
-            for dirpath, _, filenames in os.walk(root_path):
-                for filename in filenames:
-                    ext = get_file_extension(filename)
-                    if ext in extensions_lower:
-                        file_path = os.path.join(dirpath, filename)
-                        matching_files.append(file_path)
-                        
-                        processed += 1
-                        if progress_callback:
-                            progress_callback(processed, total_files)
-            
+            # Single scandir pass: DirEntry type info comes from the directory listing,
+            # so no per-entry stat and no second walk just to count for progress
+            matching_files = [
+                entry.path for entry in _iter_files(root_path)
+                if get_file_extension(entry.name) in extensions_lower
+            ]
         except OSError as e:
             raise FileSystemError(f"Failed to scan directory '{root_path}': {e}") from e
         
+        if progress_callback:
+            total_files = len(matching_files)
+            progress_callback(0, total_files)
+            progress_callback(total_files, total_files)
+        
         return matching_files
     
     def read_file(self, path: str) -> bytes:
@@ -106,13 +96,15 @@ class FileSystemService(IFileSystemService):
         except OSError as e:
             raise FileSystemError(f"Failed to read file '{path}': {e}") from e
     
-    def write_file(self, path: str, content: bytes) -> None:
+    def write_file(self, path: str, content: bytes, create_parents: bool = True) -> None:
         """
         Write binary content to a file.
         
         Args:
             path: The file path to write to.
             content: Binary content to write.
+            create_parents: Whether to create missing parent directories first
+                (callers that pre-create the tree pass False to skip the per-file makedirs).
             
         Raises:
             FileSystemError: If file writing fails.
@@ -120,11 +112,19 @@ class FileSystemService(IFileSystemService):
         try:
             # Ensure parent directory exists
             parent_dir = os.path.dirname(path)
-            if parent_dir:
+            if create_parents and parent_dir:
                 self.create_directory(parent_dir)
             
-            with open(path, 'wb') as f:
-                f.write(content)
+            # Raw fd write: the content is a single in-memory blob, so a buffered file
+            # object would only add per-file overhead (and a copy for small files)
+            fd = os.open(path, _WRITE_FLAGS, 0o666)
+            try:
+                view = memoryview(content)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
         except OSError as e:
             raise FileSystemError(f"Failed to write file '{path}': {e}") from e
     
@@ -145,3 +145,27 @@ class FileSystemService(IFileSystemService):
             return os.path.getsize(path)
         except OSError as e:
             raise FileSystemError(f"Failed to get size of file '{path}': {e}") from e
+
+
+def _iter_files(path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the files under path, top-down.
+    
+    Like os.walk: symlinks to files are listed, symlinked directories are
+    not descended into (no loops), and unreadable subdirectories are skipped.
+    """
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():  # Follows symlinks, as read_file does
+                    yield entry
+            except OSError:
+                continue
+    for subdir in subdirs:
+        try:
+            yield from _iter_files(subdir)
+        except OSError:
+            continue
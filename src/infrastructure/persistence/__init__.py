@@ -1,6 +1,9 @@
 """Persistence implementations."""
 
 from .json_repository import JsonSnapshotRepository
+from .msgpack_repository import MsgpackSnapshotRepository
 from .settings_repository import SettingsRepository
+from .two_file_repository import TwoFileSnapshotRepository
 
-__all__ = ['JsonSnapshotRepository', 'SettingsRepository']
+__all__ = ['JsonSnapshotRepository', 'MsgpackSnapshotRepository', 'SettingsRepository',
+           'TwoFileSnapshotRepository']
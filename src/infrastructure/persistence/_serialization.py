@@ -0,0 +1,30 @@
+"""JSON (de)serialization helpers shared by the snapshot repositories."""
+
+import json
+from typing import Dict, Any
+
+try:
+    import orjson  # Optional C (de)serializer; the stdlib json module is the fallback
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps_json(data: Dict[str, Any]) -> bytes:
+    """Serialize snapshot data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_json_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one NDJSON record: compact UTF-8 JSON plus a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def loads_json(data_bytes: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON bytes into snapshot data."""
+    if orjson is not None:
+        return orjson.loads(data_bytes)
+    return json.loads(data_bytes.decode('utf-8'))
@@ -2,7 +2,12 @@
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
+
+try:
+    import zstandard  # Optional; only needed for compressed .zst snapshots
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
 
 from ...domain.interfaces.repository import ISnapshotRepository
 from ...domain.interfaces.encoder import IContentEncoder
@@ -15,10 +20,17 @@ from ...shared.exceptions import (
     InvalidSnapshotError,
     DecryptionError
 )
+from ._serialization import dumps_json, dumps_json_line, loads_json
+
+
+# Paths ending in this are written zstd-compressed (e.g. 'snapshot.json.zst')
+COMPRESSED_SNAPSHOT_EXTENSION = '.zst'
+ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
 
 
 class JsonSnapshotRepository(ISnapshotRepository):
-    """Persists snapshots as JSON files with optional encryption."""
+    """Persists snapshots as JSON files with optional compression and encryption."""
     
     def __init__(self, encoder: IContentEncoder, 
                  encryption_service: Optional[IEncryptionService] = None):
@@ -57,9 +69,12 @@ class JsonSnapshotRepository(ISnapshotRepository):
             # Convert to dict
             data = snapshot.to_dict()
             
-            # Convert to JSON string
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
-            json_bytes = json_str.encode('utf-8')
+            # Serialize to UTF-8 JSON bytes
+            json_bytes = dumps_json(data)
+            
+            # Compress for '.zst' paths (before encrypting: ciphertext doesn't compress)
+            if path.lower().endswith(COMPRESSED_SNAPSHOT_EXTENSION):
+                json_bytes = _compress(json_bytes)
             
             # Encrypt if password provided
             if password and self._encryption_service:
@@ -76,6 +91,8 @@ class JsonSnapshotRepository(ISnapshotRepository):
                 
         except (OSError, IOError) as e:
             raise RepositoryError(f"Failed to save snapshot to '{path}': {e}") from e
+        except RepositoryError:
+            raise
         except Exception as e:
             raise RepositoryError(f"Unexpected error saving snapshot: {e}") from e
     
@@ -113,16 +130,19 @@ class JsonSnapshotRepository(ISnapshotRepository):
                 # Decrypt
                 data_bytes = self._encryption_service.decrypt(data_bytes, password)
             
+            # Decompress if the payload is a zstd frame (detected by magic, not extension)
+            if data_bytes.startswith(_ZSTD_MAGIC):
+                data_bytes = _decompress(data_bytes)
+            
             # Parse JSON
-            json_str = data_bytes.decode('utf-8')
-            data: Dict[str, Any] = json.loads(json_str)
+            data: Dict[str, Any] = loads_json(data_bytes)
             
             # Validate required fields
             if 'files' not in data:
                 raise InvalidSnapshotError("Snapshot is missing 'files' field")
             
             # Decode file contents
-            files: list[FileEntry] = []
+            files: List[FileEntry] = []
             for file_data in data['files']:
                 if 'path' not in file_data or 'content_base64' not in file_data:
                     raise InvalidSnapshotError(
@@ -146,11 +166,11 @@ class JsonSnapshotRepository(ISnapshotRepository):
             
         except DecryptionError:
             raise
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             raise InvalidSnapshotError(f"Invalid JSON in snapshot file: {e}") from e
         except (OSError, IOError) as e:
             raise RepositoryError(f"Failed to load snapshot from '{path}': {e}") from e
-        except InvalidSnapshotError:
+        except (InvalidSnapshotError, RepositoryError):
             raise
         except Exception as e:
             raise RepositoryError(f"Unexpected error loading snapshot: {e}") from e
@@ -158,3 +178,131 @@ class JsonSnapshotRepository(ISnapshotRepository):
     def exists(self, path: str) -> bool:
         """Check if a snapshot exists at the given path."""
         return os.path.isfile(path)
+    
+    def save_ndjson(self, snapshot: DirectorySnapshot, path: str) -> None:
+        """
+        Save a snapshot as NDJSON: one header line, then one line per file entry.
+        
+        Entries are serialized and written one at a time, so the whole document
+        never has to exist in memory. NDJSON snapshots are not encrypted.
+        
+        Args:
+            snapshot: The snapshot to save.
+            path: The file path where to save the snapshot.
+            
+        Raises:
+            RepositoryError: If saving fails.
+        """
+        try:
+            # Validate snapshot before saving
+            snapshot.validate()
+            
+            header = {
+                'root_path': snapshot.root_path,
+                'created_at': snapshot.created_at.isoformat(),
+                'metadata': snapshot.metadata,
+                'directories': [d.relative_path for d in snapshot.directories],
+                'file_count': snapshot.get_file_count()
+            }
+            
+            # Ensure parent directory exists
+            parent_dir = os.path.dirname(path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            
+            with open(path, 'wb') as f:
+                f.write(dumps_json_line(header))
+                for file_entry in snapshot.files:
+                    file_entry.set_encoded_content(self._encoder.encode(file_entry.content))
+                    f.write(dumps_json_line(file_entry.to_dict()))
+                    
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to save snapshot to '{path}': {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error saving snapshot: {e}") from e
+    
+    def load_ndjson(
+        self,
+        path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> DirectorySnapshot:
+        """
+        Load a snapshot written by save_ndjson, parsing one entry line at a time.
+        
+        Args:
+            path: The file path to load the snapshot from.
+            progress_callback: Optional callback receiving (loaded, total) per entry.
+            
+        Returns:
+            The loaded DirectorySnapshot instance.
+            
+        Raises:
+            SnapshotNotFoundError: If the snapshot file doesn't exist.
+            InvalidSnapshotError: If the snapshot data is corrupted.
+            RepositoryError: If loading fails for other reasons.
+        """
+        if not self.exists(path):
+            raise SnapshotNotFoundError(f"Snapshot file not found: {path}")
+        
+        try:
+            with open(path, 'rb') as f:
+                header_line = f.readline()
+                if not header_line.strip():
+                    raise InvalidSnapshotError("NDJSON snapshot is missing its header line")
+                header: Dict[str, Any] = loads_json(header_line)
+                total = header.get('file_count', 0)
+                
+                if progress_callback:
+                    progress_callback(0, total)
+                
+                files: List[FileEntry] = []
+                for line in f:
+                    if not line.strip():
+                        continue
+                    file_data = loads_json(line)
+                    if 'path' not in file_data or 'content_base64' not in file_data:
+                        raise InvalidSnapshotError(
+                            "File entry missing required fields (path, content_base64)"
+                        )
+                    content = self._encoder.decode(file_data['content_base64'])
+                    files.append(FileEntry.from_dict(file_data, content))
+                    
+                    if progress_callback:
+                        progress_callback(len(files), total)
+            
+            if len(files) != total:
+                raise InvalidSnapshotError(
+                    f"NDJSON snapshot is truncated: expected {total} files, found {len(files)}"
+                )
+            
+            snapshot = DirectorySnapshot.from_dict(header, files)
+            
+            # Validate snapshot
+            snapshot.validate()
+            
+            return snapshot
+            
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
+            raise InvalidSnapshotError(f"Invalid JSON in snapshot file: {e}") from e
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to load snapshot from '{path}': {e}") from e
+        except InvalidSnapshotError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error loading snapshot: {e}") from e
+
+
+def _compress(data_bytes: bytes) -> bytes:
+    """Compress a serialized snapshot with zstd."""
+    if zstandard is None:
+        raise RepositoryError("Compressed '.zst' snapshots require the 'zstandard' package")
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data_bytes)
+
+
+def _decompress(data_bytes: bytes) -> bytes:
+    """Decompress a zstd-compressed snapshot."""
+    if zstandard is None:
+        raise RepositoryError("Compressed snapshots require the 'zstandard' package")
+    # decompressobj copes with frames that don't record their content size
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data_bytes)
+
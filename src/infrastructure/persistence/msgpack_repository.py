@@ -0,0 +1,170 @@
+"""MessagePack snapshot repository implementation."""
+
+import os
+from typing import Dict, Any, List, Optional
+
+try:
+    import msgpack  # Optional; only needed for binary .snap snapshots
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+from ...domain.interfaces.repository import ISnapshotRepository
+from ...domain.interfaces.encryption import IEncryptionService
+from ...domain.models.snapshot import DirectorySnapshot
+from ...domain.models.file_entry import FileEntry
+from ...shared.exceptions import (
+    RepositoryError,
+    SnapshotNotFoundError,
+    InvalidSnapshotError,
+    DecryptionError
+)
+
+# Snapshot files with this extension are stored as MessagePack instead of JSON
+BINARY_SNAPSHOT_EXTENSION = '.snap'
+
+
+class MsgpackSnapshotRepository(ISnapshotRepository):
+    """
+    Persists snapshots as MessagePack files with optional encryption.
+    
+    File contents are stored as raw bytes, so there is no base64 expansion
+    and no string escaping on either side.
+    """
+    
+    def __init__(self, encryption_service: Optional[IEncryptionService] = None):
+        """
+        Initialize the repository.
+        
+        Args:
+            encryption_service: Optional encryption service for encrypted snapshots.
+        """
+        self._encryption_service = encryption_service
+    
+    def save(self, snapshot: DirectorySnapshot, path: str,
+             password: Optional[str] = None) -> None:
+        """
+        Save a snapshot to a MessagePack file with optional encryption.
+        
+        Args:
+            snapshot: The snapshot to save.
+            path: The file path where to save the snapshot.
+            password: Optional password for encryption.
+        
+        Raises:
+            RepositoryError: If saving fails or msgpack is not installed.
+        """
+        _require_msgpack()
+        try:
+            # Validate snapshot before saving
+            snapshot.validate()
+            
+            # Same layout as the JSON format, with raw 'content' instead of 'content_base64'
+            data = {
+                'root_path': snapshot.root_path,
+                'created_at': snapshot.created_at.isoformat(),
+                'metadata': snapshot.metadata,
+                'directories': [d.relative_path for d in snapshot.directories],
+                'files': [
+                    {**f.to_dict(include_content=False), 'content': f.content}
+                    for f in snapshot.files
+                ]
+            }
+            packed = msgpack.packb(data, use_bin_type=True)
+            
+            # Encrypt if password provided
+            if password and self._encryption_service:
+                packed = self._encryption_service.encrypt(packed, password)
+            
+            # Ensure parent directory exists
+            parent_dir = os.path.dirname(path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            
+            with open(path, 'wb') as f:
+                f.write(packed)
+        
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to save snapshot to '{path}': {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error saving snapshot: {e}") from e
+    
+    def load(self, path: str, password: Optional[str] = None) -> DirectorySnapshot:
+        """
+        Load a snapshot from a MessagePack file with automatic encryption detection.
+        
+        Args:
+            path: The file path to load the snapshot from.
+            password: Optional password for decryption (required if file is encrypted).
+        
+        Returns:
+            The loaded DirectorySnapshot instance.
+        
+        Raises:
+            SnapshotNotFoundError: If the snapshot file doesn't exist.
+            InvalidSnapshotError: If the snapshot data is corrupted.
+            DecryptionError: If file is encrypted and password is not provided.
+            RepositoryError: If loading fails for other reasons or msgpack is not installed.
+        """
+        if not self.exists(path):
+            raise SnapshotNotFoundError(f"Snapshot file not found: {path}")
+        _require_msgpack()
+        
+        try:
+            with open(path, 'rb') as f:
+                data_bytes = f.read()
+            
+            # Check if encrypted and decrypt if needed
+            if self._encryption_service and self._encryption_service.is_encrypted(data_bytes):
+                if not password:
+                    raise DecryptionError(
+                        "This snapshot is encrypted. Please provide a password to decrypt it."
+                    )
+                data_bytes = self._encryption_service.decrypt(data_bytes, password)
+            
+            try:
+                data: Dict[str, Any] = msgpack.unpackb(data_bytes, raw=False)
+            except (ValueError, msgpack.UnpackException) as e:
+                raise InvalidSnapshotError(f"Invalid MessagePack in snapshot file: {e}") from e
+            
+            # Validate required fields
+            if not isinstance(data, dict) or 'files' not in data:
+                raise InvalidSnapshotError("Snapshot is missing 'files' field")
+            
+            files: List[FileEntry] = []
+            for file_data in data['files']:
+                if 'path' not in file_data or 'content' not in file_data:
+                    raise InvalidSnapshotError(
+                        "File entry missing required fields (path, content)"
+                    )
+                files.append(FileEntry.from_dict(file_data, file_data['content']))
+            
+            snapshot = DirectorySnapshot.from_dict(data, files)
+            
+            # Validate snapshot
+            snapshot.validate()
+            
+            return snapshot
+        
+        except (DecryptionError, InvalidSnapshotError):
+            raise
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to load snapshot from '{path}': {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error loading snapshot: {e}") from e
+    
+    def exists(self, path: str) -> bool:
+        """Check if a snapshot exists at the given path."""
+        return os.path.isfile(path)
+
+
+def is_binary_snapshot_path(path: Optional[str]) -> bool:
+    """Check whether a snapshot path selects the MessagePack format."""
+    return bool(path) and path.lower().endswith(BINARY_SNAPSHOT_EXTENSION)
+
+
+def _require_msgpack() -> None:
+    """Raise a RepositoryError if the optional msgpack package is missing."""
+    if msgpack is None:
+        raise RepositoryError(
+            f"Binary '{BINARY_SNAPSHOT_EXTENSION}' snapshots require the 'msgpack' package"
+        )
@@ -0,0 +1,184 @@
+"""Two-file (JSON index + raw blob) snapshot repository implementation."""
+
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+from ...domain.interfaces.repository import ISnapshotRepository
+from ...domain.models.snapshot import DirectorySnapshot
+from ...domain.models.file_entry import FileEntry
+from ...shared.exceptions import (
+    RepositoryError,
+    SnapshotNotFoundError,
+    InvalidSnapshotError
+)
+from ._serialization import dumps_json, loads_json
+
+# Index files with this extension are stored in the two-file format
+TWO_FILE_SNAPSHOT_EXTENSION = '.snapidx'
+# Suffix appended to the index path to name its raw content file
+BLOB_EXTENSION = '.blob'
+
+
+class TwoFileSnapshotRepository(ISnapshotRepository):
+    """
+    Persists snapshots as a JSON index plus a sidecar blob of raw file bytes.
+    
+    The index (at the given path) holds paths, sizes, checksums and blob offsets;
+    the blob (the index path plus '.blob') is the plain concatenation of all file
+    contents. Nothing is base64-encoded: loading reads each file's bytes straight
+    from the blob, and the blob is closed before load returns.
+    
+    Not encrypted: saving with a password is rejected rather than silently
+    writing the contents in the clear.
+    """
+    
+    def save(self, snapshot: DirectorySnapshot, path: str,
+             password: Optional[str] = None) -> None:
+        """
+        Save a snapshot as a JSON index and a raw blob.
+        
+        Args:
+            snapshot: The snapshot to save.
+            path: The index file path; the blob goes next to it.
+            password: Must be empty; this format does not support encryption.
+        
+        Raises:
+            RepositoryError: If saving fails or a password is given.
+        """
+        if password:
+            raise RepositoryError(
+                f"'{TWO_FILE_SNAPSHOT_EXTENSION}' snapshots can't be encrypted; "
+                "save as .json or .snap to use a password"
+            )
+        blob_path = blob_path_for(path)
+        try:
+            # Validate snapshot before saving
+            snapshot.validate()
+            
+            # Ensure parent directory exists
+            parent_dir = os.path.dirname(path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            
+            # Write contents back to back, recording where each one starts. Written to
+            # a temp file and swapped in, so a failed save never leaves a truncated blob.
+            files_index = []
+            offset = 0
+            tmp_blob_path = blob_path + '.tmp'
+            try:
+                with open(tmp_blob_path, 'wb') as blob:
+                    for file_entry in snapshot.files:
+                        blob.write(file_entry.content)
+                        files_index.append({
+                            **file_entry.to_dict(include_content=False),
+                            'offset': offset
+                        })
+                        offset += file_entry.size
+                os.replace(tmp_blob_path, blob_path)
+            except BaseException:
+                # Don't leave a half-written blob behind
+                try:
+                    os.remove(tmp_blob_path)
+                except OSError:
+                    pass
+                raise
+            
+            index = {
+                'root_path': snapshot.root_path,
+                'created_at': snapshot.created_at.isoformat(),
+                'metadata': snapshot.metadata,
+                'directories': [d.relative_path for d in snapshot.directories],
+                'blob_size': offset,
+                'files': files_index
+            }
+            with open(path, 'wb') as f:
+                f.write(dumps_json(index))
+        
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to save snapshot to '{path}': {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error saving snapshot: {e}") from e
+    
+    def load(self, path: str, password: Optional[str] = None) -> DirectorySnapshot:
+        """
+        Load a snapshot from a JSON index and its blob.
+        
+        Args:
+            path: The index file path.
+            password: Ignored; two-file snapshots are never encrypted.
+        
+        Returns:
+            The loaded DirectorySnapshot instance.
+        
+        Raises:
+            SnapshotNotFoundError: If the index doesn't exist.
+            InvalidSnapshotError: If the blob is missing or the snapshot data is corrupted.
+            RepositoryError: If loading fails for other reasons.
+        """
+        if not self.exists(path):
+            raise SnapshotNotFoundError(f"Snapshot file not found: {path}")
+        
+        try:
+            with open(path, 'rb') as f:
+                index: Dict[str, Any] = loads_json(f.read())
+            
+            if 'files' not in index:
+                raise InvalidSnapshotError("Snapshot is missing 'files' field")
+            
+            blob_path = blob_path_for(path)
+            if not os.path.isfile(blob_path):
+                raise InvalidSnapshotError(f"Snapshot blob is missing: {blob_path}")
+            files: List[FileEntry] = []
+            with open(blob_path, 'rb') as blob:
+                blob_size = os.fstat(blob.fileno()).st_size
+                if blob_size != index.get('blob_size', blob_size):
+                    raise InvalidSnapshotError(
+                        f"Blob size mismatch: expected {index['blob_size']}, got {blob_size}"
+                    )
+                
+                for file_data in index['files']:
+                    if 'path' not in file_data or 'offset' not in file_data or 'size' not in file_data:
+                        raise InvalidSnapshotError(
+                            "File entry missing required fields (path, offset, size)"
+                        )
+                    start = file_data['offset']
+                    if start < 0 or start + file_data['size'] > blob_size:
+                        raise InvalidSnapshotError(
+                            f"File entry '{file_data['path']}' points outside the blob"
+                        )
+                    # One read per file straight into its own bytes object (entries are
+                    # written in order, so the seeks are sequential)
+                    blob.seek(start)
+                    files.append(FileEntry.from_dict(file_data, blob.read(file_data['size'])))
+            
+            snapshot = DirectorySnapshot.from_dict(index, files)
+            
+            # Validate snapshot
+            snapshot.validate()
+            
+            return snapshot
+        
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
+            raise InvalidSnapshotError(f"Invalid JSON in snapshot index: {e}") from e
+        except (OSError, IOError) as e:
+            raise RepositoryError(f"Failed to load snapshot from '{path}': {e}") from e
+        except InvalidSnapshotError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error loading snapshot: {e}") from e
+    
+    def exists(self, path: str) -> bool:
+        """Check if a snapshot index exists (load reports a missing blob separately)."""
+        return os.path.isfile(path)
+
+
+def is_two_file_snapshot_path(path: Optional[str]) -> bool:
+    """Check whether a path names a two-file snapshot index (by extension)."""
+    return bool(path) and path.lower().endswith(TWO_FILE_SNAPSHOT_EXTENSION)
+
+
+def blob_path_for(path: str) -> str:
+    """Get the blob path that belongs to an index path (unique per index, e.g. 'snap.json.blob')."""
+    return path + BLOB_EXTENSION
+
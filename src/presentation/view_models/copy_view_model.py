@@ -115,7 +115,7 @@ class CopyViewModel(QObject):
             self.message_logged.emit(f"💾 Saving snapshot to: {path}")
         
         # Create and configure worker
-        use_case = self._container.get_save_snapshot_use_case()
+        use_case = self._container.get_save_snapshot_use_case(path)
         worker = AsyncWorker(use_case.execute, snapshot, path, password)
         
         # Connect signals
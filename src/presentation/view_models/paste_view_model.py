@@ -83,7 +83,7 @@ class PasteViewModel(QObject):
             self.message_logged.emit(f"📂 Loading snapshot from: {path}")
         
         # Create and configure worker
-        use_case = self._container.get_load_snapshot_use_case()
+        use_case = self._container.get_load_snapshot_use_case(path)
         worker = AsyncWorker(use_case.execute, path, password)
         
         # Connect signals
@@ -134,7 +134,7 @@ class CopyWidget(QWidget):
             self,
             "Save Snapshot As",
             self.json_edit.text(),
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;Compressed JSON (*.json.zst);;Binary Snapshots (*.snap);;Index + Blob Snapshots (*.snapidx);;All Files (*)"
         )
         if file_path:
             self.json_edit.setText(file_path)
@@ -132,7 +132,7 @@ class PasteWidget(QWidget):
             self,
             "Open Snapshot File",
             self.json_edit.text(),
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;Compressed JSON (*.json.zst);;Binary Snapshots (*.snap);;Index + Blob Snapshots (*.snapidx);;All Files (*)"
         )
         if file_path:
             self.json_edit.setText(file_path)
@@ -1,8 +1,35 @@
 """Unit tests configuration."""
 
-import sys
-from pathlib import Path
+import pytest
 
-# Add src directory to Python path
-src_path = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_path))
+
+@pytest.fixture(scope="session")
+def large_payload():
+    """1 MB payload, allocated once per session (bytes are immutable, so sharing is safe)."""
+    return b"X" * 1_000_000
+
+
+@pytest.fixture(scope="session")
+def unicode_payload():
+    """UTF-8 encoded multi-script text, shared across the session."""
+    return "Hello 世界 🌍 Ελληνικά Русский".encode('utf-8')
+
+
+# PBKDF2 rounds used by the test session (a single HMAC); test_kdf_real covers the real count
+TEST_PBKDF2_ITERATIONS = 1
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_kdf():
+    """
+    Lower AESGCMEncryptor's PBKDF2 iteration count for the whole session.
+    
+    Salts are random per encryption, so memoizing derived keys would rarely hit;
+    the iteration count is what dominates. Yields the production count.
+    """
+    from src.infrastructure.encryption.aes_gcm_encryptor import AESGCMEncryptor
+    
+    real_iterations = AESGCMEncryptor.PBKDF2_ITERATIONS
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AESGCMEncryptor, "PBKDF2_ITERATIONS", TEST_PBKDF2_ITERATIONS)
+        yield real_iterations
@@ -0,0 +1,17 @@
+"""Integration tests configuration."""
+
+import pytest
+
+from src.di_container import DIContainer
+
+
+@pytest.fixture(scope="session")
+def container():
+    """
+    Shared DI container for the integration tests.
+    
+    The container only holds stateless services (encoder, file system,
+    encryption, repositories) and builds fresh use cases on every call,
+    so one instance can safely serve the whole session.
+    """
+    return DIContainer()
@@ -3,6 +3,7 @@
 import os
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.infrastructure.encryption.aes_gcm_encryptor import AESGCMEncryptor
@@ -12,6 +13,23 @@ from src.domain.models.snapshot import DirectorySnapshot
 from src.domain.models.file_entry import FileEntry
 
 
+def _walk(root):
+    """Yield every file entry below root (uses cached DirEntry type info, no extra stat())."""
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
+
+def _read_all(path, size):
+    """Read a whole file into a buffer pre-sized from its stat() size."""
+    buf = bytearray(size)
+    with open(path, 'rb', buffering=0) as f:  # Unbuffered: readinto goes straight to the OS
+        filled = f.readinto(buf)
+    return bytes(buf[:filled])
+
+
 def test_encrypted_snapshot_workflow():
     """Test complete workflow: save encrypted → load encrypted → recreate."""
     
@@ -43,19 +61,19 @@ def test_encrypted_snapshot_workflow():
         print("📸 Creating snapshot...")
         files = []
         
-        for root, dirs, filenames in os.walk(source_dir):
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, source_dir)
-                
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                file_entry = FileEntry(
-                    relative_path=rel_path,
-                    content=content
-                )
-                files.append(file_entry)
+        entries = list(_walk(source_dir))
+        sizes = [entry.stat(follow_symlinks=False).st_size for entry in entries]
+        
+        # Submit all reads at once instead of reading one file after another
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(_read_all, [entry.path for entry in entries], sizes))
+        
+        for entry, content in zip(entries, contents):
+            file_entry = FileEntry(
+                relative_path=os.path.relpath(entry.path, source_dir),
+                content=content
+            )
+            files.append(file_entry)
         
         snapshot = DirectorySnapshot(
             root_path=source_dir,
@@ -101,10 +119,12 @@ def test_encrypted_snapshot_workflow():
         # Step 6: Recreate directory
         print(f"📂 Recreating directory to: {output_dir}")
         
-        # Manually recreate files
+        # Manually recreate files: create each directory once (parents first), then write files
+        dirs = {os.path.dirname(os.path.join(output_dir, fe.relative_path)) for fe in loaded_snapshot.files}
+        for d in sorted(dirs, key=len):
+            os.makedirs(d, exist_ok=True)
         for file_entry in loaded_snapshot.files:
             output_path = os.path.join(output_dir, file_entry.relative_path)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'wb') as f:
                 f.write(file_entry.content)
         
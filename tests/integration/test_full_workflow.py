@@ -3,14 +3,32 @@
 import os
 import json
 import tempfile
-import shutil
 from pathlib import Path
 
 import pytest
 
-from src.di_container import DIContainer
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from src.application.dto.scan_request import ScanRequest
 from src.application.dto.recreate_request import RecreateRequest
+from src.domain.models.snapshot import DirectorySnapshot
+from src.domain.models.file_entry import FileEntry
+from src.infrastructure.persistence import json_repository
+from src.infrastructure.persistence.two_file_repository import (
+    TwoFileSnapshotRepository,
+    blob_path_for
+)
+from src.shared.exceptions import InvalidSnapshotError, RepositoryError
+
+from ._fast_rmtree import fast_rmtree
 
 
 @pytest.fixture
@@ -18,15 +36,16 @@ def temp_dirs():
     """Create temporary directories for testing."""
     source_dir = tempfile.mkdtemp(prefix="sagittarius_source_")
     output_dir = tempfile.mkdtemp(prefix="sagittarius_output_")
-    json_file = os.path.join(tempfile.gettempdir(), "test_snapshot.json")
+    # Per-test directory for the snapshot file, so parallel (xdist) workers never share it
+    snapshot_dir = tempfile.mkdtemp(prefix="sagittarius_snapshot_")
+    json_file = os.path.join(snapshot_dir, "test_snapshot.json")
     
     yield source_dir, output_dir, json_file
     
     # Cleanup
-    shutil.rmtree(source_dir, ignore_errors=True)
-    shutil.rmtree(output_dir, ignore_errors=True)
-    if os.path.exists(json_file):
-        os.remove(json_file)
+    fast_rmtree(source_dir)
+    fast_rmtree(output_dir)
+    fast_rmtree(snapshot_dir)
 
 
 @pytest.fixture
@@ -34,11 +53,7 @@ def sample_files(temp_dirs):
     """Create sample files in source directory."""
     source_dir, _, _ = temp_dirs
     
-    # Create directory structure
-    os.makedirs(os.path.join(source_dir, "subfolder1"))
-    os.makedirs(os.path.join(source_dir, "subfolder2", "nested"))
-    
-    # Create sample files
+    # Sample files
     files = {
         "readme.txt": "This is a readme file\nWith multiple lines\n",
         "config.json": '{"key": "value", "number": 42}',
@@ -48,10 +63,13 @@ def sample_files(temp_dirs):
         "subfolder2/nested/deep.log": "Log entry 1\nLog entry 2\n",
     }
     
+    # Create each parent directory once, then write pre-encoded payloads
+    for parent in sorted({os.path.dirname(rel_path) for rel_path in files}):
+        if parent:
+            os.makedirs(os.path.join(source_dir, parent), exist_ok=True)
+    
     for rel_path, content in files.items():
-        file_path = os.path.join(source_dir, rel_path)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        Path(source_dir, rel_path).write_bytes(content.encode("utf-8"))
     
     return files
 
@@ -59,15 +77,21 @@ def sample_files(temp_dirs):
 class TestFullWorkflow:
     """Test the complete snapshot workflow: scan -> save -> load -> recreate."""
     
-    def test_complete_workflow(self, temp_dirs, sample_files):
+    @pytest.mark.parametrize("snapshot_ext", [
+        ".json",
+        pytest.param(".snap", marks=pytest.mark.skipif(msgpack is None, reason="msgpack not installed")),
+        pytest.param(".json.zst", marks=pytest.mark.skipif(zstandard is None, reason="zstandard not installed")),
+        ".snapidx",
+    ])
+    def test_complete_workflow(self, container, temp_dirs, sample_files, snapshot_ext):
         """Test the complete workflow from scanning to recreation."""
         source_dir, output_dir, json_file = temp_dirs
+        json_file = os.path.splitext(json_file)[0] + snapshot_ext
         
-        # Step 1: Create container and use cases
-        container = DIContainer()
+        # Step 1: Create use cases
         scan_use_case = container.get_scan_directory_use_case()
-        save_use_case = container.get_save_snapshot_use_case()
-        load_use_case = container.get_load_snapshot_use_case()
+        save_use_case = container.get_save_snapshot_use_case(json_file)
+        load_use_case = container.get_load_snapshot_use_case(json_file)
         recreate_use_case = container.get_recreate_directory_use_case()
         
         # Step 2: Scan directory
@@ -123,11 +147,10 @@ class TestFullWorkflow:
             assert recreated_content == original_content, \
                 f"Content mismatch for {rel_path}"
     
-    def test_scan_with_extension_filter(self, temp_dirs, sample_files):
+    def test_scan_with_extension_filter(self, container, temp_dirs, sample_files):
         """Test scanning with extension filtering."""
         source_dir, _, _ = temp_dirs
         
-        container = DIContainer()
         scan_use_case = container.get_scan_directory_use_case()
         
         # Only scan .txt files
@@ -144,7 +167,7 @@ class TestFullWorkflow:
         for file_entry in snapshot.files:
             assert file_entry.relative_path.endswith(".txt")
     
-    def test_empty_directory_handling(self, temp_dirs):
+    def test_empty_directory_handling(self, container, temp_dirs):
         """Test handling of empty directories."""
         source_dir, output_dir, json_file = temp_dirs
         
@@ -152,7 +175,6 @@ class TestFullWorkflow:
         os.makedirs(os.path.join(source_dir, "empty1"))
         os.makedirs(os.path.join(source_dir, "empty2", "nested_empty"))
         
-        container = DIContainer()
         scan_use_case = container.get_scan_directory_use_case()
         save_use_case = container.get_save_snapshot_use_case()
         load_use_case = container.get_load_snapshot_use_case()
@@ -186,11 +208,10 @@ class TestFullWorkflow:
         # Save and load should still work with empty snapshot
         assert os.path.exists(output_dir)
     
-    def test_json_format_validation(self, temp_dirs, sample_files):
+    def test_json_format_validation(self, container, temp_dirs, sample_files):
         """Test that saved JSON has correct format."""
         source_dir, _, json_file = temp_dirs
         
-        container = DIContainer()
         scan_use_case = container.get_scan_directory_use_case()
         save_use_case = container.get_save_snapshot_use_case()
         
@@ -221,11 +242,129 @@ class TestFullWorkflow:
             assert "checksum" in file_data
             assert "content_base64" in file_data
     
-    def test_progress_callback(self, temp_dirs, sample_files):
+    def test_ndjson_roundtrip(self, container, temp_dirs, sample_files):
+        """Test that NDJSON snapshots round-trip and stream one entry per line."""
+        source_dir, _, json_file = temp_dirs
+        
+        scan_use_case = container.get_scan_directory_use_case()
+        repository = container.get_snapshot_repository()
+        
+        scan_request = ScanRequest(
+            root_path=source_dir,
+            extensions=[".txt", ".py", ".json", ".md", ".log"],
+            progress_callback=None
+        )
+        snapshot = scan_use_case.execute(scan_request)
+        repository.save_ndjson(snapshot, json_file)
+        
+        # Header line plus one line per file
+        with open(json_file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1 + len(snapshot.files)
+        assert json.loads(lines[0])["file_count"] == len(snapshot.files)
+        
+        progress = []
+        loaded_snapshot = repository.load_ndjson(
+            json_file, lambda current, total: progress.append((current, total))
+        )
+        
+        assert loaded_snapshot.root_path == snapshot.root_path
+        assert len(loaded_snapshot.directories) == len(snapshot.directories)
+        assert {f.relative_path: f.content for f in loaded_snapshot.files} == \
+            {f.relative_path: f.content for f in snapshot.files}
+        total = len(snapshot.files)
+        assert progress == [(i, total) for i in range(total + 1)]
+    
+    def test_two_file_roundtrip(self, container, temp_dirs, sample_files):
+        """Test that index + blob snapshots round-trip and recreate correctly."""
+        source_dir, output_dir, json_file = temp_dirs
+        
+        scan_use_case = container.get_scan_directory_use_case()
+        recreate_use_case = container.get_recreate_directory_use_case()
+        repository = TwoFileSnapshotRepository()
+        
+        scan_request = ScanRequest(
+            root_path=source_dir,
+            extensions=[".txt", ".py", ".json", ".md", ".log"],
+            progress_callback=None
+        )
+        snapshot = scan_use_case.execute(scan_request)
+        repository.save(snapshot, json_file)
+        
+        # Index has offsets instead of inline content; blob holds the raw bytes
+        with open(json_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        assert all("offset" in f and "content_base64" not in f for f in index["files"])
+        assert os.path.getsize(blob_path_for(json_file)) == snapshot.get_total_size()
+        
+        loaded_snapshot = repository.load(json_file)
+        assert all(type(f.content) is bytes for f in loaded_snapshot.files)
+        assert {f.relative_path: f.content for f in loaded_snapshot.files} == \
+            {f.relative_path: f.content for f in snapshot.files}
+        
+        recreate_use_case.execute(RecreateRequest(
+            snapshot=loaded_snapshot,
+            output_path=output_dir,
+            progress_callback=None
+        ))
+        for rel_path, original_content in sample_files.items():
+            with open(os.path.join(output_dir, rel_path), "r", encoding="utf-8") as f:
+                assert f.read() == original_content, f"Content mismatch for {rel_path}"
+        
+        # Re-saving a loaded snapshot to the same path
+        repository.save(loaded_snapshot, json_file)
+        assert repository.load(json_file).get_total_size() == snapshot.get_total_size()
+        
+        # Indexes that differ only in extension get their own blobs
+        other_index = os.path.splitext(json_file)[0] + ".idx"
+        repository.save(DirectorySnapshot(root_path=snapshot.root_path), other_index)
+        assert blob_path_for(other_index) != blob_path_for(json_file)
+        assert repository.load(json_file).get_total_size() == snapshot.get_total_size()
+        
+        # A missing blob is reported as a broken snapshot, not a missing one
+        os.remove(blob_path_for(json_file))
+        assert repository.exists(json_file)
+        with pytest.raises(InvalidSnapshotError, match="blob is missing"):
+            repository.load(json_file)
+    
+    def test_two_file_snapshots_reject_passwords(self, container, temp_dirs):
+        """Test that .snapidx paths select the two-file repository, which refuses to encrypt."""
+        _, _, json_file = temp_dirs
+        index_file = os.path.splitext(json_file)[0] + ".snapidx"
+        assert isinstance(container.get_snapshot_repository(index_file), TwoFileSnapshotRepository)
+        
+        save_use_case = container.get_save_snapshot_use_case(index_file)
+        with pytest.raises(RepositoryError, match="can't be encrypted"):
+            save_use_case.execute(DirectorySnapshot(root_path="/test"), index_file, "secret")
+        assert not os.path.exists(index_file)
+    
+    def test_two_file_failed_save_leaves_no_temp_blob(self, temp_dirs, monkeypatch):
+        """Test that a save failing mid-blob removes its temp file and raises RepositoryError."""
+        _, _, json_file = temp_dirs
+        snapshot = DirectorySnapshot(root_path="/test")
+        snapshot.add_file(FileEntry(relative_path="a.txt", content=b"a"))
+        
+        def fail_to_dict(self, include_content=True):
+            raise OSError("disk full")
+        monkeypatch.setattr(FileEntry, "to_dict", fail_to_dict)
+        
+        with pytest.raises(RepositoryError):
+            TwoFileSnapshotRepository().save(snapshot, json_file)
+        assert not os.path.exists(blob_path_for(json_file) + ".tmp")
+    
+    def test_missing_zstandard_error_is_not_rewrapped(self, container, temp_dirs, monkeypatch):
+        """Test that the repository's own 'zstandard missing' error reaches the caller unchanged."""
+        monkeypatch.setattr(json_repository, "zstandard", None)
+        _, _, json_file = temp_dirs
+        repository = container.get_snapshot_repository()
+        
+        with pytest.raises(RepositoryError, match="^Compressed '.zst' snapshots require"):
+            repository.save(DirectorySnapshot(root_path="/test"), json_file + ".zst")
+    
+    def test_progress_callback(self, container, temp_dirs, sample_files):
         """Test that progress callbacks are invoked."""
         source_dir, output_dir, json_file = temp_dirs
         
-        container = DIContainer()
         scan_use_case = container.get_scan_directory_use_case()
         save_use_case = container.get_save_snapshot_use_case()
         load_use_case = container.get_load_snapshot_use_case()
@@ -10,12 +10,43 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QEventLoop, QTimer
 from src.di_container import DIContainer
 from src.presentation.view_models.paste_view_model import PasteViewModel
 from src.shared.exceptions import DecryptionError, InvalidPasswordError
 
 
+# Upper bound for each asynchronous load; waits end as soon as the signal fires
+SIGNAL_TIMEOUT_MS = 10000
+
+
+def _wait_for(signal):
+    """
+    Run an event loop until signal fires or SIGNAL_TIMEOUT_MS passes.
+    
+    Returns:
+        The signal's arguments as a tuple, or None on timeout.
+    """
+    received = []
+    loop = QEventLoop()
+    
+    def on_signal(*args):
+        received.append(args)
+        loop.quit()
+    
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
+    
+    signal.connect(on_signal)
+    timer.start(SIGNAL_TIMEOUT_MS)
+    loop.exec()
+    timer.stop()
+    signal.disconnect(on_signal)
+    
+    return received[0] if received else None
+
+
 def test_load_encrypted_with_password():
     """Test loading encrypted file triggers password dialog."""
     
@@ -43,8 +74,22 @@ def test_load_encrypted_with_password():
         'test_passed': False
     }
     
-    def on_load_error(error_msg: str, exception: object):
-        """Handle load error - should get DecryptionError first."""
+    # Start test
+    print("🚀 Starting test...")
+    print(f"📄 File: {file_path}")
+    print(f"🔑 Test password: {test_password}")
+    print()
+    
+    # Attempt to load encrypted file (signals are delivered once the wait's loop runs)
+    print("▶️  Step 0: Attempting to load encrypted file...")
+    viewmodel.load_snapshot(file_path)
+    error_args = _wait_for(viewmodel.load_error)
+    
+    if error_args is None:
+        print(f"\n❌ TIMEOUT: No load error within {SIGNAL_TIMEOUT_MS // 1000} seconds")
+    else:
+        # Load error - should get DecryptionError first
+        error_msg, exception = error_args
         results['load_error_called'] = True
         results['error_msg'] = error_msg
         results['exception_type'] = type(exception).__name__ if exception else None
@@ -63,50 +108,23 @@ def test_load_encrypted_with_password():
             # Retry with password
             print(f"✅ Step 4: Retrying load with password...")
             viewmodel.load_snapshot(file_path, test_password)
+            completed_args = _wait_for(viewmodel.load_completed)
+            
+            if completed_args is None:
+                print(f"\n❌ TIMEOUT: Load did not complete within {SIGNAL_TIMEOUT_MS // 1000} seconds")
+            else:
+                snapshot = completed_args[0]
+                results['load_completed'] = True
+                
+                print(f"✅ Step 5: Load completed successfully!")
+                print(f"   Files: {snapshot.get_file_count()}")
+                print(f"   Directories: {snapshot.get_directory_count()}")
+                print(f"   Root: {snapshot.root_path}")
+                
+                results['test_passed'] = True
         else:
             print(f"❌ FAIL: Expected DecryptionError, got {results['exception_type']}")
             results['test_passed'] = False
-            app.quit()
-    
-    def on_load_completed(snapshot):
-        """Handle successful load."""
-        results['load_completed'] = True
-        
-        print(f"✅ Step 5: Load completed successfully!")
-        print(f"   Files: {snapshot.get_file_count()}")
-        print(f"   Directories: {snapshot.get_directory_count()}")
-        print(f"   Root: {snapshot.root_path}")
-        
-        results['test_passed'] = True
-        
-        # Success - quit
-        QTimer.singleShot(100, app.quit)
-    
-    def on_timeout():
-        """Timeout if test takes too long."""
-        print("\n❌ TIMEOUT: Test took too long (10 seconds)")
-        results['test_passed'] = False
-        app.quit()
-    
-    # Connect signals
-    viewmodel.load_error.connect(on_load_error)
-    viewmodel.load_completed.connect(on_load_completed)
-    
-    # Set timeout
-    QTimer.singleShot(10000, on_timeout)
-    
-    # Start test
-    print("🚀 Starting test...")
-    print(f"📄 File: {file_path}")
-    print(f"🔑 Test password: {test_password}")
-    print()
-    
-    # Attempt to load encrypted file
-    print("▶️  Step 0: Attempting to load encrypted file...")
-    viewmodel.load_snapshot(file_path)
-    
-    # Run event loop
-    app.exec()
     
     # Print results
     print()
@@ -163,41 +181,6 @@ def test_wrong_password():
         'test_passed': False
     }
     
-    error_count = [0]  # Use list to make it mutable in nested function
-    
-    def on_load_error(error_msg: str, exception: object):
-        """Handle load errors."""
-        error_count[0] += 1
-        
-        if error_count[0] == 1:
-            # First error - should be DecryptionError
-            results['first_error'] = type(exception).__name__
-            print(f"✅ Step 1: First error = {results['first_error']}")
-            
-            if isinstance(exception, DecryptionError):
-                print(f"✅ Step 2: Trying with WRONG password...")
-                viewmodel.load_snapshot(file_path, wrong_password)
-        
-        elif error_count[0] == 2:
-            # Second error - should be InvalidPasswordError
-            results['second_error'] = type(exception).__name__
-            print(f"✅ Step 3: Second error = {results['second_error']}")
-            
-            if isinstance(exception, InvalidPasswordError):
-                print(f"✅ Step 4: InvalidPasswordError correctly raised!")
-                results['test_passed'] = True
-            else:
-                print(f"❌ Expected InvalidPasswordError, got {results['second_error']}")
-            
-            # Done
-            QTimer.singleShot(100, app.quit)
-    
-    # Connect signal
-    viewmodel.load_error.connect(on_load_error)
-    
-    # Set timeout
-    QTimer.singleShot(10000, lambda: (print("\n❌ TIMEOUT"), app.quit()))
-    
     # Start test
     print("🚀 Starting wrong password test...")
     print(f"📄 File: {file_path}")
@@ -205,9 +188,34 @@ def test_wrong_password():
     print()
     
     viewmodel.load_snapshot(file_path)
+    error_args = _wait_for(viewmodel.load_error)
     
-    # Run event loop
-    app.exec()
+    if error_args is None:
+        print("\n❌ TIMEOUT")
+    else:
+        # First error - should be DecryptionError
+        exception = error_args[1]
+        results['first_error'] = type(exception).__name__
+        print(f"✅ Step 1: First error = {results['first_error']}")
+        
+        if isinstance(exception, DecryptionError):
+            print(f"✅ Step 2: Trying with WRONG password...")
+            viewmodel.load_snapshot(file_path, wrong_password)
+            error_args = _wait_for(viewmodel.load_error)
+            
+            if error_args is None:
+                print("\n❌ TIMEOUT")
+            else:
+                # Second error - should be InvalidPasswordError
+                exception = error_args[1]
+                results['second_error'] = type(exception).__name__
+                print(f"✅ Step 3: Second error = {results['second_error']}")
+                
+                if isinstance(exception, InvalidPasswordError):
+                    print(f"✅ Step 4: InvalidPasswordError correctly raised!")
+                    results['test_passed'] = True
+                else:
+                    print(f"❌ Expected InvalidPasswordError, got {results['second_error']}")
     
     # Print results
     print()
@@ -0,0 +1,15 @@
+"""Shared fixtures for domain model tests."""
+
+import pytest
+
+from src.domain.models.file_entry import FileEntry
+
+
+@pytest.fixture(scope="module")
+def hello_entry():
+    """
+    A file entry with content b"hello", built (and hashed) once per module.
+    
+    Treat as read-only; tests that mutate an entry should take copy.copy(hello_entry).
+    """
+    return FileEntry(relative_path="test.py", content=b"hello")
@@ -22,61 +22,42 @@ def test_extension_filter_custom_extensions():
     assert '.md' in filter
 
 
-def test_extension_filter_add_extension():
-    """Test adding an extension."""
-    filter = ExtensionFilter([])
-    
-    filter.add_extension('.py')
-    
-    assert '.py' in filter
-    assert len(filter) == 1
-
-
-def test_extension_filter_add_without_dot():
-    """Test adding extension without leading dot."""
-    filter = ExtensionFilter([])
-    
-    filter.add_extension('py')  # Without dot
-    
-    assert '.py' in filter
-
-
-def test_extension_filter_case_insensitive():
-    """Test that extensions are case-insensitive."""
-    filter = ExtensionFilter([])
-    
-    filter.add_extension('.PY')
-    
-    assert '.py' in filter
-    assert '.PY' in filter
-
-
-def test_extension_filter_remove_extension():
-    """Test removing an extension."""
-    filter = ExtensionFilter(['.py', '.txt'])
-    
-    filter.remove_extension('.py')
-    
-    assert '.py' not in filter
-    assert '.txt' in filter
-
-
-def test_extension_filter_is_allowed():
+@pytest.mark.parametrize("initial,op,extension,expected_in,expected_not_in,expected_len", [
+    pytest.param([], 'add_extension', '.py', ['.py'], [], 1, id="add"),
+    pytest.param([], 'add_extension', 'py', ['.py'], [], 1, id="add_without_dot"),
+    pytest.param([], 'add_extension', '.PY', ['.py', '.PY'], [], 1, id="add_case_insensitive"),
+    pytest.param(['.py', '.txt'], 'remove_extension', '.py', ['.txt'], ['.py'], 1, id="remove"),
+    # No operation: 'in' works with and without the leading dot
+    pytest.param(['.py', '.txt'], None, None, ['.py', 'py'], ['.cpp'], 2, id="contains"),
+])
+def test_extension_filter_membership(initial, op, extension, expected_in, expected_not_in, expected_len):
+    """Test adding, removing and checking extensions (dot and case are normalized)."""
+    filter = ExtensionFilter(initial)
+    
+    if op is not None:
+        getattr(filter, op)(extension)
+    
+    for ext in expected_in:
+        assert ext in filter
+    for ext in expected_not_in:
+        assert ext not in filter
+    assert len(filter) == expected_len
+
+
+@pytest.mark.parametrize("extensions,filename,expected", [
+    (['.py', '.txt'], 'test.py', True),
+    (['.py', '.txt'], 'README.txt', True),
+    (['.py', '.txt'], 'image.jpg', False),
+    (['.py', '.txt'], 'noextension', False),
+    # File checking is case-insensitive
+    (['.py'], 'test.PY', True),
+    (['.py'], 'TEST.Py', True),
+])
+def test_extension_filter_is_allowed(extensions, filename, expected):
     """Test checking if filename is allowed."""
-    filter = ExtensionFilter(['.py', '.txt'])
+    filter = ExtensionFilter(extensions)
     
-    assert filter.is_allowed('test.py') is True
-    assert filter.is_allowed('README.txt') is True
-    assert filter.is_allowed('image.jpg') is False
-    assert filter.is_allowed('noextension') is False
-
-
-def test_extension_filter_is_allowed_case_insensitive():
-    """Test that file checking is case-insensitive."""
-    filter = ExtensionFilter(['.py'])
-    
-    assert filter.is_allowed('test.PY') is True
-    assert filter.is_allowed('TEST.Py') is True
+    assert filter.is_allowed(filename) is expected
 
 
 def test_extension_filter_get_extensions():
@@ -118,15 +99,6 @@ def test_extension_filter_len():
     assert len(filter) == 3
 
 
-def test_extension_filter_contains():
-    """Test 'in' operator."""
-    filter = ExtensionFilter(['.py', '.txt'])
-    
-    assert '.py' in filter
-    assert 'py' in filter  # Should work without dot too
-    assert '.cpp' not in filter
-
-
 def test_extension_filter_str_repr():
     """Test string representations."""
     filter = ExtensionFilter(['.py', '.txt'])
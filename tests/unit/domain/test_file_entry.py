@@ -1,5 +1,7 @@
 """Unit tests for FileEntry domain model."""
 
+import copy
+
 import pytest
 
 from src.domain.models.file_entry import FileEntry
@@ -43,6 +45,27 @@ def test_file_entry_checksum_mismatch():
     assert entry.validate_checksum() is False
 
 
+def test_file_entry_checksum_tampered():
+    """Test checksum validation fails after the stored checksum changes."""
+    entry = FileEntry(relative_path="test.py", content=b"original")
+    assert entry.validate_checksum() is True
+    
+    entry.checksum = "0" * 64
+    
+    assert entry.validate_checksum() is False
+
+
+def test_file_entry_checksum_mutable_content():
+    """Test checksum validation re-hashes in-place mutable content."""
+    content = bytearray(b"original")
+    entry = FileEntry(relative_path="test.py", content=content)
+    assert entry.validate_checksum() is True
+    
+    content[0:1] = b"O"
+    
+    assert entry.validate_checksum() is False
+
+
 def test_file_entry_get_extension():
     """Test getting file extension."""
     entry1 = FileEntry(relative_path="test.py", content=b"")
@@ -63,47 +86,51 @@ def test_file_entry_encoded_content():
     assert entry.get_encoded_content() == "aGVsbG8="
 
 
-def test_file_entry_to_dict_without_content():
-    """Test converting to dict without encoded content raises error."""
-    entry = FileEntry(relative_path="test.py", content=b"test")
+@pytest.mark.parametrize("encoded,include_content,expected_error", [
+    pytest.param(None, True, "no encoded content", id="content_not_encoded"),
+    pytest.param("aGVsbG8=", True, None, id="with_content"),
+    pytest.param(None, False, None, id="without_content"),
+])
+def test_file_entry_to_dict(hello_entry, encoded, include_content, expected_error):
+    """Test converting to dict with and without encoded content."""
+    entry = copy.copy(hello_entry)  # The shared entry stays unencoded
+    if encoded is not None:
+        entry.set_encoded_content(encoded)
     
-    with pytest.raises(ValidationError, match="no encoded content"):
-        entry.to_dict(include_content=True)
-
-
-def test_file_entry_to_dict_with_content():
-    """Test converting to dict with encoded content."""
-    entry = FileEntry(relative_path="test.py", content=b"hello")
-    entry.set_encoded_content("aGVsbG8=")
+    if expected_error:
+        with pytest.raises(ValidationError, match=expected_error):
+            entry.to_dict(include_content=include_content)
+        return
     
-    data = entry.to_dict(include_content=True)
+    data = entry.to_dict(include_content=include_content)
     
     assert data['path'] == "test.py"
     assert data['size'] == 5
     assert 'checksum' in data
-    assert data['content_base64'] == "aGVsbG8="
-
-
-def test_file_entry_to_dict_without_content_param():
-    """Test converting to dict without content."""
-    entry = FileEntry(relative_path="test.py", content=b"hello")
-    
-    data = entry.to_dict(include_content=False)
-    
-    assert data['path'] == "test.py"
-    assert data['size'] == 5
-    assert 'checksum' in data
-    assert 'content_base64' not in data
-
-
-def test_file_entry_from_dict():
-    """Test creating file entry from dictionary."""
+    if include_content:
+        assert data['content_base64'] == encoded
+    else:
+        assert 'content_base64' not in data
+
+
+@pytest.mark.parametrize("checksum,expected_error", [
+    # SHA-256 of "hello"
+    pytest.param("2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824", None, id="valid"),
+    pytest.param("wrong_checksum_value", "Checksum mismatch", id="checksum_mismatch"),
+])
+def test_file_entry_from_dict(checksum, expected_error):
+    """Test creating file entry from dictionary (the checksum must match the content)."""
     data = {
         'path': "test.py",
         'size': 5,
-        'checksum': "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"  # SHA-256 of "hello"
+        'checksum': checksum
     }
     
+    if expected_error:
+        with pytest.raises(ValidationError, match=expected_error):
+            FileEntry.from_dict(data, b"hello")
+        return
+    
     entry = FileEntry.from_dict(data, b"hello")
     
     assert entry.relative_path == "test.py"
@@ -111,26 +138,12 @@ def test_file_entry_from_dict():
     assert entry.size == 5
 
 
-def test_file_entry_from_dict_checksum_mismatch():
-    """Test creating from dict with wrong checksum raises error."""
-    data = {
-        'path': "test.py",
-        'size': 5,
-        'checksum': "wrong_checksum_value"
-    }
-    
-    with pytest.raises(ValidationError, match="Checksum mismatch"):
-        FileEntry.from_dict(data, b"hello")
-
-
-def test_file_entry_str_repr():
+def test_file_entry_str_repr(hello_entry):
     """Test string representations."""
-    entry = FileEntry(relative_path="test.py", content=b"12345")
-    
-    str_repr = str(entry)
+    str_repr = str(hello_entry)
     assert "test.py" in str_repr
     assert "5 bytes" in str_repr
     
-    repr_str = repr(entry)
+    repr_str = repr(hello_entry)
     assert "FileEntry" in repr_str
     assert "test.py" in repr_str
@@ -1,5 +1,6 @@
 """Unit tests for DirectorySnapshot domain model."""
 
+import copy
 import pytest
 from datetime import datetime
 
@@ -9,6 +10,12 @@ from src.domain.models.directory_entry import DirectoryEntry
 from src.shared.exceptions import ValidationError
 
 
+@pytest.fixture
+def snapshot():
+    """An empty snapshot rooted at /test (fresh per test, since tests add to it)."""
+    return DirectorySnapshot(root_path="/test")
+
+
 def test_snapshot_creation():
     """Test creating a new snapshot."""
     snapshot = DirectorySnapshot(root_path="/test/path")
@@ -19,10 +26,8 @@ def test_snapshot_creation():
     assert isinstance(snapshot.created_at, datetime)
 
 
-def test_snapshot_add_directory():
+def test_snapshot_add_directory(snapshot):
     """Test adding directories to snapshot."""
-    snapshot = DirectorySnapshot(root_path="/test")
-    
     snapshot.add_directory("src")
     snapshot.add_directory("src/domain")
     
@@ -30,10 +35,8 @@ def test_snapshot_add_directory():
     assert all(isinstance(d, DirectoryEntry) for d in snapshot.directories)
 
 
-def test_snapshot_add_file():
+def test_snapshot_add_file(snapshot):
     """Test adding files to snapshot."""
-    snapshot = DirectorySnapshot(root_path="/test")
-    
     file1 = FileEntry(relative_path="test1.py", content=b"content1")
     file2 = FileEntry(relative_path="test2.py", content=b"content2")
     
@@ -44,20 +47,22 @@ def test_snapshot_add_file():
     assert all(isinstance(f, FileEntry) for f in snapshot.files)
 
 
-def test_snapshot_get_total_size():
+@pytest.mark.parametrize("contents,expected_size", [
+    pytest.param([b"12345", b"1234567890"], 15, id="two_files"),
+    pytest.param([b""], 0, id="empty_file"),
+    pytest.param([], 0, id="no_files"),
+])
+def test_snapshot_get_total_size(snapshot, contents, expected_size):
     """Test calculating total size of files."""
-    snapshot = DirectorySnapshot(root_path="/test")
-    
-    snapshot.add_file(FileEntry(relative_path="a.txt", content=b"12345"))  # 5 bytes
-    snapshot.add_file(FileEntry(relative_path="b.txt", content=b"1234567890"))  # 10 bytes
+    for i, content in enumerate(contents):
+        snapshot.add_file(FileEntry(relative_path=f"file{i}.txt", content=content))
     
-    assert snapshot.get_total_size() == 15
+    assert snapshot.get_total_size() == expected_size
 
 
-def test_snapshot_validate_success():
+def test_snapshot_validate_success(snapshot, hello_entry):
     """Test validation of valid snapshot."""
-    snapshot = DirectorySnapshot(root_path="/test")
-    snapshot.add_file(FileEntry(relative_path="test.py", content=b"test"))
+    snapshot.add_file(hello_entry)
     
     assert snapshot.validate() is True
 
@@ -70,10 +75,8 @@ def test_snapshot_validate_missing_root():
         snapshot.validate()
 
 
-def test_snapshot_validate_duplicate_files():
+def test_snapshot_validate_duplicate_files(snapshot):
     """Test validation fails with duplicate file paths."""
-    snapshot = DirectorySnapshot(root_path="/test")
-    
     snapshot.add_file(FileEntry(relative_path="test.py", content=b"a"))
     snapshot.add_file(FileEntry(relative_path="test.py", content=b"b"))
     
@@ -81,12 +84,11 @@ def test_snapshot_validate_duplicate_files():
         snapshot.validate()
 
 
-def test_snapshot_to_dict():
+def test_snapshot_to_dict(snapshot, hello_entry):
     """Test converting snapshot to dictionary."""
-    snapshot = DirectorySnapshot(root_path="/test")
     snapshot.add_directory("src")
     
-    file_entry = FileEntry(relative_path="test.py", content=b"hello")
+    file_entry = copy.copy(hello_entry)
     file_entry.set_encoded_content("aGVsbG8=")  # base64 of "hello"
     snapshot.add_file(file_entry)
     
@@ -119,9 +121,8 @@ def test_snapshot_from_dict():
     assert snapshot.get_file_count() == 1
 
 
-def test_snapshot_statistics():
+def test_snapshot_statistics(snapshot):
     """Test getting snapshot statistics."""
-    snapshot = DirectorySnapshot(root_path="/test")
     snapshot.add_directory("src")
     snapshot.add_file(FileEntry(relative_path="test.py", content=b"12345"))
     snapshot.add_file(FileEntry(relative_path="test.txt", content=b"67890"))
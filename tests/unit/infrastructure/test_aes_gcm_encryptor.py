@@ -1,32 +1,51 @@
 """Unit tests for AES-GCM encryptor."""
 
+import hashlib
+import io
+
 import pytest
 from src.infrastructure.encryption.aes_gcm_encryptor import AESGCMEncryptor
 from src.shared.exceptions import EncryptionError, DecryptionError, InvalidPasswordError
 
 
-class TestAESGCMEncryptor:
-    """Test suite for AES-GCM encryption implementation."""
+@pytest.fixture(scope="module")
+def encryptor():
+    """Create an encryptor instance (stateless apart from its derived-key cache)."""
+    return AESGCMEncryptor()
+
+
+@pytest.fixture(scope="module")
+def sample_data():
+    """Sample plaintext data for testing."""
+    return b"This is a test message for encryption."
+
+
+@pytest.fixture(scope="module")
+def sample_password():
+    """Sample password for testing."""
+    return "Test_Password_123!"
+
 
-    @pytest.fixture
-    def encryptor(self):
-        """Create an encryptor instance."""
-        return AESGCMEncryptor()
+@pytest.fixture(scope="module")
+def encrypted_sample(encryptor, sample_data, sample_password):
+    """sample_data encrypted once and shared (bytes, so tests cannot mutate it)."""
+    return encryptor.encrypt(sample_data, sample_password)
 
-    @pytest.fixture
-    def sample_data(self):
-        """Sample plaintext data for testing."""
-        return b"This is a test message for encryption."
 
-    @pytest.fixture
-    def sample_password(self):
-        """Sample password for testing."""
-        return "Test_Password_123!"
+@pytest.fixture(scope="module")
+def encrypted_sample_2(encryptor, sample_data, sample_password):
+    """A second, independent encryption of sample_data (fresh salt and nonce)."""
+    return encryptor.encrypt(sample_data, sample_password)
 
-    def test_encrypt_decrypt_roundtrip(self, encryptor, sample_data, sample_password):
+
+class TestAESGCMEncryptor:
+    """Test suite for AES-GCM encryption implementation."""
+
+    def test_encrypt_decrypt_roundtrip(
+        self, encryptor, sample_data, sample_password, encrypted_sample
+    ):
         """Test that data can be encrypted and then decrypted back to original."""
-        # Encrypt
-        encrypted = encryptor.encrypt(sample_data, sample_password)
+        encrypted = encrypted_sample
         
         # Verify encrypted data is different from plaintext
         assert encrypted != sample_data
@@ -39,11 +58,10 @@ class TestAESGCMEncryptor:
         assert decrypted == sample_data
 
     def test_encrypt_produces_different_output_each_time(
-        self, encryptor, sample_data, sample_password
+        self, encryptor, sample_data, sample_password, encrypted_sample, encrypted_sample_2
     ):
         """Test that encrypting the same data twice produces different ciphertext (due to random salt/nonce)."""
-        encrypted1 = encryptor.encrypt(sample_data, sample_password)
-        encrypted2 = encryptor.encrypt(sample_data, sample_password)
+        encrypted1, encrypted2 = encrypted_sample, encrypted_sample_2
         
         # Different ciphertext due to random salt and nonce
         assert encrypted1 != encrypted2
@@ -52,135 +70,123 @@ class TestAESGCMEncryptor:
         assert encryptor.decrypt(encrypted1, sample_password) == sample_data
         assert encryptor.decrypt(encrypted2, sample_password) == sample_data
 
-    def test_wrong_password_raises_invalid_password_error(
-        self, encryptor, sample_data, sample_password
-    ):
+    def test_wrong_password_raises_invalid_password_error(self, encryptor, encrypted_sample):
         """Test that decrypting with wrong password raises InvalidPasswordError."""
-        encrypted = encryptor.encrypt(sample_data, sample_password)
-        
         with pytest.raises(InvalidPasswordError) as exc_info:
-            encryptor.decrypt(encrypted, "WrongPassword123!")
+            encryptor.decrypt(encrypted_sample, "WrongPassword123!")
         
         assert "Authentication failed" in str(exc_info.value)
 
-    def test_is_encrypted_detects_encrypted_data(self, encryptor, sample_data, sample_password):
-        """Test that is_encrypted correctly identifies encrypted data."""
-        encrypted = encryptor.encrypt(sample_data, sample_password)
-        
-        assert encryptor.is_encrypted(encrypted) is True
-
-    def test_is_encrypted_rejects_plaintext(self, encryptor, sample_data):
-        """Test that is_encrypted returns False for plaintext data."""
-        assert encryptor.is_encrypted(sample_data) is False
-
-    def test_is_encrypted_rejects_invalid_header(self, encryptor):
-        """Test that is_encrypted returns False for data with wrong magic header."""
-        fake_data = b"WRONGHEADER" + b"\x00" * 100
-        
-        assert encryptor.is_encrypted(fake_data) is False
-
-    def test_is_encrypted_rejects_wrong_version(self, encryptor, sample_data, sample_password):
-        """Test that is_encrypted returns False for data with unsupported version."""
-        encrypted = encryptor.encrypt(sample_data, sample_password)
-        
-        # Modify version byte (position 6 after MAGIC_HEADER)
-        corrupted = bytearray(encrypted)
-        corrupted[6] = 99  # Invalid version number
-        
-        assert encryptor.is_encrypted(bytes(corrupted)) is False
+    def test_wrong_then_right_password_uses_cached_key(
+        self, encryptor, sample_data, sample_password, encrypted_sample, monkeypatch
+    ):
+        """Test that a retry after a wrong password decrypts and reuses derived keys."""
+        encrypted = encrypted_sample
+        
+        with pytest.raises(InvalidPasswordError):
+            encryptor.decrypt(encrypted, "Wrong_Password")
+        
+        # Both keys are cached now: key derivation must not run again
+        def fail_derive(*args, **kwargs):
+            raise AssertionError("PBKDF2 should not run for a cached key")
+        monkeypatch.setattr(
+            "src.infrastructure.encryption.aes_gcm_encryptor.PBKDF2HMAC", fail_derive
+        )
+        
+        assert encryptor.decrypt(encrypted, sample_password) == sample_data
+        with pytest.raises(InvalidPasswordError):
+            encryptor.decrypt(encrypted, "Wrong_Password")
+
+    def test_kdf_real(self, fast_kdf, monkeypatch):
+        """Test key derivation at the production iteration count (the session lowers it)."""
+        # Production default keeps the OWASP-recommended PBKDF2 work factor
+        assert fast_kdf >= 100000
+        monkeypatch.setattr(AESGCMEncryptor, "PBKDF2_ITERATIONS", fast_kdf)
+        salt = b"\x01" * AESGCMEncryptor.SALT_SIZE
+        
+        # Own instance: the shared one caches keys derived at the lowered count
+        key = AESGCMEncryptor()._derive_key("Test_Password_123!", salt)
+        
+        expected = hashlib.pbkdf2_hmac(
+            'sha256', b"Test_Password_123!", salt, fast_kdf, AESGCMEncryptor.KEY_SIZE
+        )
+        assert key == expected
+
+    @pytest.mark.parametrize("mutator,expected", [
+        pytest.param(lambda x: x, True, id="encrypted"),
+        pytest.param(lambda x: b"This is a test message for encryption.", False, id="plaintext"),
+        pytest.param(lambda x: b"WRONGHEADER" + b"\x00" * 100, False, id="invalid_header"),
+        # Unsupported version byte (position 6 after MAGIC_HEADER)
+        pytest.param(lambda x: x[:6] + bytes([99]) + x[7:], False, id="wrong_version"),
+        pytest.param(lambda x: x[:6], False, id="missing_version"),
+    ])
+    def test_is_encrypted_cases(self, encryptor, encrypted_sample, mutator, expected):
+        """Test that is_encrypted accepts encrypted data and rejects anything with a bad header."""
+        assert encryptor.is_encrypted(mutator(encrypted_sample)) is expected
 
     def test_decrypt_corrupted_data_raises_decryption_error(
-        self, encryptor, sample_data, sample_password
+        self, encryptor, sample_password, encrypted_sample
     ):
         """Test that decrypting corrupted data raises DecryptionError."""
-        encrypted = encryptor.encrypt(sample_data, sample_password)
-        
         # Corrupt the ciphertext (last part contains ciphertext + tag)
-        corrupted = bytearray(encrypted)
-        corrupted[-10] ^= 0xFF  # Flip bits in ciphertext
+        # Flip bits in one ciphertext byte, splicing slices instead of copying twice
+        corrupted = (
+            encrypted_sample[:-10] + bytes([encrypted_sample[-10] ^ 0xFF]) + encrypted_sample[-9:]
+        )
         
         with pytest.raises(DecryptionError):
-            encryptor.decrypt(bytes(corrupted), sample_password)
-
-    def test_decrypt_truncated_data_raises_decryption_error(self, encryptor):
-        """Test that decrypting truncated data raises DecryptionError."""
-        # Create data that's too short
-        truncated = b"SAGENC\x01" + b"\x00" * 10
-        
+            encryptor.decrypt(corrupted, sample_password)
+
+    @pytest.mark.parametrize("data,message", [
+        pytest.param(b"SAGENC\x01" + b"\x00" * 10, "too short", id="truncated"),
+        pytest.param(b"INVALID" + b"\x00" * 100, "Not an encrypted file", id="invalid_header"),
+    ])
+    def test_decrypt_malformed_data_raises_decryption_error(self, encryptor, data, message):
+        """Test that decrypting truncated or non-encrypted data raises DecryptionError."""
         with pytest.raises(DecryptionError) as exc_info:
-            encryptor.decrypt(truncated, "password")
+            encryptor.decrypt(data, "password")
+        
+        assert message in str(exc_info.value)
+
+    @pytest.mark.parametrize("data,password", [
+        # GCM can encrypt empty data - it will just contain the authentication tag
+        pytest.param(b"", "Test_Password_123!", id="empty"),
+        # Strings name session fixtures (see tests/conftest.py), resolved in the test
+        pytest.param("large_payload", "Test_Password_123!", id="large"),
+        pytest.param("unicode_payload", "Test_Password_123!", id="unicode"),
+        pytest.param(b"data", "P@ssw0rd!#$%^&*()_+-=[]{}|;:',.<>?/~`", id="special_pw"),
+        pytest.param(b"data", "a" * 1000, id="long_pw"),
+        # Empty password works (though not recommended in practice)
+        pytest.param(b"data", "", id="empty_pw"),
+    ])
+    def test_encrypt_decrypt_roundtrip_variants(self, request, encryptor, data, password):
+        """Test that unusual payloads and passwords survive an encrypt/decrypt roundtrip."""
+        if isinstance(data, str):
+            data = request.getfixturevalue(data)
+        
+        encrypted = encryptor.encrypt(data, password)
+        decrypted = encryptor.decrypt(encrypted, password)
+        
+        assert decrypted == data
+
+    @pytest.mark.parametrize("payload", ["large_payload", "unicode_payload"])
+    def test_encrypt_stream_roundtrip(self, request, encryptor, sample_password, payload, monkeypatch):
+        """Test that chunked stream encryption produces data decrypt() reads back."""
+        data = request.getfixturevalue(payload)
+        # Small chunks so the large payload spans many update() calls
+        monkeypatch.setattr(AESGCMEncryptor, "STREAM_CHUNK_SIZE", 64 * 1024)
+        destination = io.BytesIO()
+        
+        encryptor.encrypt_stream(io.BytesIO(data), destination, sample_password)
+        encrypted = destination.getvalue()
         
-        assert "too short" in str(exc_info.value)
-
-    def test_encrypt_empty_data(self, encryptor, sample_password):
-        """Test that encrypting empty data works correctly."""
-        empty_data = b""
-        
-        encrypted = encryptor.encrypt(empty_data, sample_password)
-        decrypted = encryptor.decrypt(encrypted, sample_password)
-        
-        # Note: GCM can encrypt empty data - it will just contain the authentication tag
-        assert decrypted == empty_data
-
-    def test_encrypt_large_data(self, encryptor, sample_password):
-        """Test that encrypting large data works correctly."""
-        large_data = b"X" * 1_000_000  # 1 MB
-        
-        encrypted = encryptor.encrypt(large_data, sample_password)
-        decrypted = encryptor.decrypt(encrypted, sample_password)
-        
-        assert decrypted == large_data
-
-    def test_encrypt_unicode_data(self, encryptor, sample_password):
-        """Test that encrypting UTF-8 encoded Unicode data works."""
-        unicode_text = "Hello 世界 🌍 Ελληνικά Русский"
-        unicode_data = unicode_text.encode('utf-8')
-        
-        encrypted = encryptor.encrypt(unicode_data, sample_password)
-        decrypted = encryptor.decrypt(encrypted, sample_password)
-        
-        assert decrypted == unicode_data
-        assert decrypted.decode('utf-8') == unicode_text
-
-    def test_password_with_special_characters(self, encryptor, sample_data):
-        """Test that passwords with special characters work correctly."""
-        special_password = "P@ssw0rd!#$%^&*()_+-=[]{}|;:',.<>?/~`"
-        
-        encrypted = encryptor.encrypt(sample_data, special_password)
-        decrypted = encryptor.decrypt(encrypted, special_password)
-        
-        assert decrypted == sample_data
-
-    def test_very_long_password(self, encryptor, sample_data):
-        """Test that very long passwords work correctly."""
-        long_password = "a" * 1000
-        
-        encrypted = encryptor.encrypt(sample_data, long_password)
-        decrypted = encryptor.decrypt(encrypted, long_password)
-        
-        assert decrypted == sample_data
-
-    def test_empty_password_works(self, encryptor, sample_data):
-        """Test that empty password works (though not recommended in practice)."""
-        empty_password = ""
-        
-        encrypted = encryptor.encrypt(sample_data, empty_password)
-        decrypted = encryptor.decrypt(encrypted, empty_password)
-        
-        assert decrypted == sample_data
-
-    def test_decrypt_with_invalid_magic_header_raises_error(self, encryptor):
-        """Test that decrypting data with invalid magic header raises DecryptionError."""
-        invalid_data = b"INVALID" + b"\x00" * 100
-        
-        with pytest.raises(DecryptionError) as exc_info:
-            encryptor.decrypt(invalid_data, "password")
-        
-        assert "Not an encrypted file" in str(exc_info.value)
+        assert encryptor.is_encrypted(encrypted) is True
+        assert len(encrypted) == len(encryptor.encrypt(data, sample_password))
+        assert encryptor.decrypt(encrypted, sample_password) == data
 
-    def test_encrypted_data_has_correct_structure(self, encryptor, sample_data, sample_password):
+    def test_encrypted_data_has_correct_structure(self, encrypted_sample):
         """Test that encrypted data has the expected structure."""
-        encrypted = encryptor.encrypt(sample_data, sample_password)
+        encrypted = memoryview(encrypted_sample)  # Header slices without copying
         
         # Check magic header (6 bytes)
         assert encrypted[:6] == b"SAGENC"
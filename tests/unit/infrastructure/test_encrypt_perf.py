@@ -0,0 +1,31 @@
+"""Performance benchmarks for AES-GCM encryption (run with: pytest -m perf)."""
+
+import os
+
+import pytest
+
+from src.infrastructure.encryption.aes_gcm_encryptor import AESGCMEncryptor
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.mark.parametrize("size", [
+    pytest.param(1024, id="1KB"),
+    pytest.param(1024 * 1024, id="1MB"),
+    pytest.param(16 * 1024 * 1024, id="16MB"),
+])
+def test_encrypt_perf(benchmark, size):
+    """Benchmark encrypt() by payload size, then check the last result decrypts."""
+    # The session's fast_kdf fixture makes key derivation a single HMAC,
+    # so the timing is dominated by AES-GCM itself
+    encryptor = AESGCMEncryptor()
+    password = "Test_Password_123!"
+    data = os.urandom(size)
+    
+    encrypted = benchmark.pedantic(
+        encryptor.encrypt, args=(data, password), rounds=5, warmup_rounds=1
+    )
+    
+    assert encryptor.decrypt(encrypted, password) == data
@@ -0,0 +1,38 @@
+"""Unit tests for FileSystemService."""
+
+import os
+
+import pytest
+
+from src.infrastructure.file_system.file_system_service import FileSystemService
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A directory with a file, a symlinked file and a symlinked directory."""
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_bytes(b"b")
+    try:
+        os.symlink(tmp_path / "a.txt", tmp_path / "link.txt")
+        os.symlink(tmp_path / "sub", tmp_path / "sublink", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks are not available on this platform")
+    return tmp_path
+
+
+def test_list_files_includes_symlinked_files(tree):
+    """Test that symlinks to files are listed, like the os.walk-based scan did."""
+    files = FileSystemService().list_files(str(tree), ['.txt'])
+    
+    names = sorted(os.path.relpath(f, tree) for f in files)
+    assert names == ['a.txt', 'link.txt', os.path.join('sub', 'b.txt')]
+
+
+def test_list_files_does_not_descend_into_symlinked_directories(tree):
+    """Test that symlinked directories are not followed (guards against loops)."""
+    os.symlink(tree, tree / "sub" / "loop", target_is_directory=True)
+    
+    files = FileSystemService().list_files(str(tree), ['.txt'])
+    
+    assert not any('sublink' in f or 'loop' in f for f in files)
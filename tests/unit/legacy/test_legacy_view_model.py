@@ -0,0 +1,115 @@
+"""Unit tests for the single-file app's ViewModel and Worker (Sagittarius-ENTJ.py)."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QSettings
+
+# The legacy app is a single script whose file name is not importable as a module name
+_SCRIPT = Path(__file__).resolve().parents[3] / "Sagittarius-ENTJ.py"
+_spec = importlib.util.spec_from_file_location("sagittarius_entj", _SCRIPT)
+legacy = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(legacy)
+
+
+@pytest.fixture
+def view_model(tmp_path, monkeypatch):
+    """
+    A ViewModel whose settings live in its own INI file under tmp_path.
+
+    The app's QSettings constructor is swapped for one bound to that file, so no
+    process-global QSettings format or path is changed for later tests.
+    """
+    app = QCoreApplication.instance() or QCoreApplication([])  # Settings thread shutdown needs one
+    ini_path = str(tmp_path / "settings.ini")
+    monkeypatch.setattr(
+        legacy, "QSettings",
+        lambda organization, application, parent=None: QSettings(ini_path, QSettings.Format.IniFormat, parent)
+    )
+    view_model = legacy.ViewModel(model=None)
+    yield view_model
+    view_model.shutdown()
+
+
+@pytest.fixture
+def extension_updates(view_model):
+    """Lists emitted by the view model's extensions_changed signal, in order."""
+    updates = []
+    view_model.extensions_changed.connect(updates.append)
+    return updates
+
+
+def test_add_extension_ignores_case(view_model, extension_updates):
+    """Test that adding the same extension in another case does not duplicate it."""
+    view_model.add_extension('.rs')
+    view_model.add_extension('.RS')
+    view_model.add_extension(' .Rs ')
+
+    assert view_model.extensions.count('.rs') == 1
+    # Only the first add changed the list; the others were recognised as duplicates
+    assert len(extension_updates) == 1
+
+
+def test_remove_extension_ignores_case(view_model, extension_updates):
+    """Test that an extension added in one case can be removed in another."""
+    view_model.add_extension('.RS')
+    view_model.add_extension('.Go')
+
+    view_model.remove_extension('.rs')
+    view_model.remove_extensions(['.GO'])
+
+    assert '.rs' not in view_model.extensions
+    assert '.go' not in view_model.extensions
+    assert '.rs' not in extension_updates[-1] and '.go' not in extension_updates[-1]
+    # Fully removed: adding it back works and lists it once
+    view_model.add_extension('.rs')
+    assert view_model.extensions.count('.rs') == 1
+
+
+@pytest.mark.parametrize("listening", [False, True])
+def test_run_task_batches_log_lines_only_with_a_listener(view_model, tmp_path, monkeypatch, listening):
+    """Test that workers produce UI log batches only if something receives message_logged."""
+    monkeypatch.setattr(legacy.Worker, "_log_dir", staticmethod(lambda: str(tmp_path)))
+    started = []
+    monkeypatch.setattr(view_model, "threadpool", type("Pool", (), {"start": staticmethod(started.append)})())
+    batches = []
+    view_model.worker_signals.log_batch.connect(batches.append)
+    if listening:
+        view_model.message_logged.connect(lambda message: None)
+
+    view_model._run_task(lambda progress_callback, file_log_callback: file_log_callback("Copied 3 files"))
+    started[0].run()  # Run the worker synchronously instead of in the pool
+
+    assert any("Copied 3 files" in batch for batch in batches) is listening
+
+
+def test_worker_keeps_only_recent_logs(tmp_path, monkeypatch):
+    """Test that opening task logs prunes all but the newest MAX_KEPT_LOGS."""
+    monkeypatch.setattr(legacy.Worker, "_log_dir", staticmethod(lambda: str(tmp_path)))
+
+    for _ in range(legacy.Worker.MAX_KEPT_LOGS + 5):
+        legacy.Worker._open_log_file().close()
+
+    assert len(list(tmp_path.glob("sagittarius_*.log"))) == legacy.Worker.MAX_KEPT_LOGS
+
+
+def test_worker_runs_task_when_log_file_cannot_be_opened(monkeypatch):
+    """Test that a failing file log does not abort the task (the log is best-effort)."""
+    def read_only_log_dir():
+        raise PermissionError("read-only app data directory")
+    monkeypatch.setattr(legacy.Worker, "_log_dir", staticmethod(read_only_log_dir))
+    signals = legacy.WorkerSignals()
+    errors, messages = [], []
+    signals.error.connect(errors.append)
+    signals.log_message.connect(messages.append)
+    ran = []
+
+    def task(progress_callback, file_log_callback):
+        file_log_callback("  [Copied] a.txt")
+        ran.append(True)
+    legacy.Worker(task, signals).run()
+
+    assert ran == [True]
+    assert errors == []
+    assert any("Could not create the log file" in m for m in messages)